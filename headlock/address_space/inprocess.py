@@ -12,18 +12,27 @@ MACHINE_WORDSIZE = 32 if architecture()[0] == '32bit' else 64
 ENDIANESS = 'little'
 
 
+_libdl = None
+
+
 def free_cdll(cdll):
+    global _libdl
     if sys.platform == 'win32':
         ct.windll.kernel32.FreeLibrary.argtypes = [wintypes.HMODULE]
         ct.windll.kernel32.FreeLibrary(cdll._handle)
     elif sys.platform == 'linux':
-        libdl = ct.CDLL('libdl.so')
-        libdl.dlclose(cdll._handle)
+        if _libdl is None:
+            # load only once, as every load results in a dlopen() call
+            _libdl = ct.CDLL('libdl.so')
+            _libdl.dlclose.argtypes = [ct.c_void_p]
+            _libdl.dlclose.restype = ct.c_int
+        _libdl.dlclose(cdll._handle)
     else:
         raise NotImplementedError('the platform is not supported yet')
 
 
 fptr_t = ct.c_uint32 if ct.sizeof(ct.CFUNCTYPE(None)) == 4 else ct.c_uint64
+fptr_p_t = ct.POINTER(fptr_t)
 
 
 class InprocessAddressSpace(AddressSpace):
@@ -59,14 +68,17 @@ class InprocessAddressSpace(AddressSpace):
         self.cdll = ct.CDLL(cdll_name)
         try:
             c2py_bridge_sig_cnt = (1 + max(c2py_bridge_sig_ids, default=0))
-            bridges_t = ct.POINTER(fptr_t) * c2py_bridge_sig_cnt
+            bridges_t = fptr_p_t * c2py_bridge_sig_cnt
             self.__c2py_bridges = bridges_t.in_dll(self.cdll, '_c2py_bridges')
-            self.cdll._py2c_bridge_.argtypes = [ct.c_int, fptr_t, ct.c_void_p,
-                                                ct.c_void_p, ct.c_void_p]
+            self.__py2c_bridge = self.cdll._py2c_bridge_
+            self.__py2c_bridge.argtypes = [ct.c_int, fptr_t, ct.c_void_p,
+                                           ct.c_void_p, ct.c_void_p]
+            self.__py2c_bridge.restype = ct.c_int
 
             self.__bridge_sigs = bridge_sigs or []
             self.__bridge_sig_map = {
-                c_sig: sig_id for sig_id,c_sig in enumerate(self.__bridge_sigs)}
+                sys.intern(c_sig): sig_id
+                for sig_id, c_sig in enumerate(self.__bridge_sigs)}
 
             self.__c2py_bridge_sig_ids = c2py_bridge_sig_ids or set()
             self.__c2py_bridges_per_sig = c2py_bridges_per_sig
@@ -79,7 +91,7 @@ class InprocessAddressSpace(AddressSpace):
                                                     '_c2py_bridge_handler')
             c2py_bridge_handler_ptr.value = ct.cast(
                 ct.pointer(self.__c2py_bridge_handler),
-                ct.POINTER(fptr_t)).contents.value
+                fptr_p_t).contents.value
         except:
             free_cdll(self.cdll)
             raise
@@ -102,7 +114,7 @@ class InprocessAddressSpace(AddressSpace):
                 # This is a workaround, as "return callstacks.jump_dests[-1]"
                 # does not work for some reason
                 jump_dest_p = ct.pointer(callstacks.jump_dests[-1])
-                return ct.cast(jump_dest_p, ct.POINTER(fptr_t)).contents.value
+                return ct.cast(jump_dest_p, fptr_p_t).contents.value
             else:
                 return None
         return c2py_bridge_handler
@@ -149,11 +161,11 @@ class InprocessAddressSpace(AddressSpace):
         else:
             jump_dest = ct.c_void_p()
             self.__callstacks.jump_dests.append(jump_dest)
-            status = self.cdll._py2c_bridge_(sig_id,
-                                             func_adr,
-                                             args_adr,
-                                             retval_adr,
-                                             ct.byref(jump_dest))
+            status = self.__py2c_bridge(sig_id,
+                                        func_adr,
+                                        args_adr,
+                                        retval_adr,
+                                        ct.byref(jump_dest))
             self.__callstacks.jump_dests.pop()
             if status == 0:
                 raise ValueError('Internal Error '
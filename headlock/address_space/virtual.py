@@ -12,6 +12,14 @@ class VirtualAddressSpace(AddressSpace):
 
     def __init__(self, content=b'', symbols=None):
         super().__init__()
+        self.reset(content, symbols)
+
+    def reset(self, content=b'', symbols=None):
+        """
+        Restores the state of a newly created object. This allows tests to
+        reuse an address space instead of creating a new one every time.
+        """
+        self.bridgepool.clear()
         self.content = bytearray(content)
         self.symbols = {}
         self.funcs = {}
@@ -49,7 +57,10 @@ class VirtualAddressSpace(AddressSpace):
     def read_memory(self, address, length):
         assert address >= 0 and length > 0
         assert address + length <= len(self.content)
-        return bytes(self.content[address:address+length])
+        # slicing a memoryview avoids the intermediate bytearray copy. The
+        # view is released immediately, as .content must stay resizable
+        with memoryview(self.content) as content_view:
+            return bytes(content_view[address:address+length])
 
     def write_memory(self, address, data):
         data = bytes(data)
@@ -59,7 +70,7 @@ class VirtualAddressSpace(AddressSpace):
 
     def alloc_memory(self, length:int):
         address = len(self.content)
-        self.content += b'\0'*length
+        self.content += bytes(length)
         return address
 
     def get_symbol_adr(self, symbol_name):
@@ -118,7 +118,7 @@ def write_c2py_bridge(output:TextIO, c2py_funcs:List[CFuncType],
 def write_c2py_bridge_func(output, sig_id, inst_ndx, name, cfunc):
     output.write(cfunc.c_definition(name) + '\n')
     output.write('{\n')
-    params_size = sum(a.sizeof for a in cfunc.args)
+    params_size = cfunc.params_size
     output.write(f'\tunsigned char params[{params_size}];\n')
     write_params_ptrs(output, cfunc.args, indent='\t')
     if cfunc.returns is not None:
@@ -33,10 +33,11 @@ class PtrArrFactoryMixIn(CProxyType):
         self._ptr = None
         super().__init__(*args, **argv)
 
-    def bind(self, addrspace):
-        bound_ctype = super().bind(addrspace)
-        bound_ctype._ptr = None
-        return bound_ctype
+    def __copy__(self):
+        # derived types (bind(), with_attr(), ...) need their own pointer type
+        derived = super().__copy__()
+        derived._ptr = None
+        return derived
 
     @property
     def ptr(self):
@@ -82,8 +83,10 @@ class CVectorType(PtrArrFactoryMixIn, vector.CVectorType): pass
 class CFuncType(PtrArrFactoryMixIn, function.CFuncType):
     @property
     def ptr(self):
-        return CFuncPointerType(self, MACHINE_WORDSIZE, ENDIANESS,
-                                self.__addrspace__)
+        if self._ptr is None:
+            self._ptr = CFuncPointerType(self, MACHINE_WORDSIZE, ENDIANESS,
+                                         self.__addrspace__)
+        return self._ptr
 class CFuncPointerType(PtrArrFactoryMixIn, funcpointer.CFuncPointerType): pass
 
 
@@ -1,4 +1,6 @@
-from .core import CProxyType, CProxy, InvalidAddressSpaceError
+import struct
+from .core import CProxyType, CProxy, InvalidAddressSpaceError, \
+    InterningMeta
 from .integer import CIntType
 from ..address_space import AddressSpace
 from collections.abc import Iterable
@@ -15,16 +17,70 @@ def map_unicode_to_list(val, base_type):
             result = list(enc_val)
         else:
             elem_len = elem_bits // 8
-            conv_val = [int.from_bytes(enc_val[pos:pos+elem_len], 'little')
-                        for pos in range(0, len(enc_val), elem_len)]
-            result = conv_val[1:]
+            fmt_char = 'H' if elem_len == 2 else 'I'
+            conv_val = struct.unpack(f'<{len(enc_val)//elem_len}{fmt_char}',
+                                     enc_val)
+            result = list(conv_val[1:])
         return result + [0]
 
 
-class CArrayType(CProxyType):
+def unicode_codec(base_type):
+    """
+    returns the name of the codec, that is used for zero-terminated strings
+    of items of type base_type. Returns None, if base_type does not support
+    unicode strings.
+    """
+    if not isinstance(base_type, CIntType) or base_type.sizeof not in (1,2,4):
+        return None
+    elif base_type.sizeof == 1:
+        return 'utf-8'
+    else:
+        endianess_suffix = 'le' if base_type.endianess == 'little' else 'be'
+        return f'utf-{base_type.sizeof*8}-{endianess_suffix}'
+
+
+def int_struct_format(base_type, count):
+    """
+    returns the struct format of an array of count items of type base_type
+    or None if base_type cannot be converted via the struct module.
+    """
+    if not isinstance(base_type, CIntType):
+        return None
+    try:
+        fmt_char = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}[base_type.sizeof]
+    except KeyError:
+        return None
+    if not base_type.signed:
+        fmt_char = fmt_char.upper()
+    endianess_char = '<' if base_type.endianess == 'little' else '>'
+    return f'{endianess_char}{count}{fmt_char}'
+
+
+def find_zero_terminator(c_repr, elem_size):
+    """
+    returns the offset of the first zero item within c_repr, whose items
+    are elem_size bytes long
+    """
+    terminator = bytes(elem_size)
+    terminator_pos = c_repr.find(terminator)
+    while terminator_pos % elem_size != 0 and terminator_pos >= 0:
+        terminator_pos = c_repr.find(terminator, terminator_pos + 1)
+    if terminator_pos < 0:
+        raise ValueError('string is not zero terminated')
+    return terminator_pos
+
+
+class CArrayType(CProxyType, metaclass=InterningMeta):
 
     PRECEDENCE = 20
 
+    @classmethod
+    def _intern_key(cls, base_type:CProxyType, element_count:int,
+                    addrspace:AddressSpace=None):
+        # see CIntType._intern_key(). As an interned object keeps its
+        # base type alive, its id is unique within the key
+        return id(base_type), element_count, id(addrspace)
+
     def __init__(self, base_type:CProxyType, element_count:int,
                  addrspace:AddressSpace=None):
         if base_type.__addrspace__ is not addrspace:
@@ -33,10 +89,21 @@ class CArrayType(CProxyType):
         super().__init__(base_type.sizeof * element_count, addrspace)
         self.base_type = base_type
         self.element_count = element_count
+        self._repr = None
+        self._c_definitions = {}
+
+    def __copy__(self):
+        # derived types may differ in attributes, so the string caches must
+        # not be shared with them
+        derived = super().__copy__()
+        derived._repr = None
+        derived._c_definitions = {}
+        return derived
 
     def bind(self, addrspace:AddressSpace):
         bound_ctype = super().bind(addrspace)
-        bound_ctype.base_type = self.base_type.bind(addrspace)
+        if bound_ctype is not self:
+            bound_ctype.base_type = self.base_type.bind(addrspace)
         return bound_ctype
 
     def shallow_eq(self, other):
@@ -44,9 +111,14 @@ class CArrayType(CProxyType):
                and self.element_count == other.element_count
 
     def __repr__(self):
-        return '_'.join([repr(self.base_type)]
-                        + sorted(self.__c_attribs__)
-                        + [f'array{self.element_count}'])
+        if self._repr is not None:
+            return self._repr
+        result = '_'.join([repr(self.base_type)]
+                          + list(self.__c_attribs__)
+                          + [f'array{self.element_count}'])
+        if self._has_constant_c_definition():
+            self._repr = result
+        return result
 
     @property
     def null_val(cls):
@@ -56,15 +128,31 @@ class CArrayType(CProxyType):
         return self.element_count
 
     def c_definition(self, refering_def=''):
-        result = f'{refering_def}[{self.element_count}]'
-        result = self._decorate_c_definition(result)
-        if self.base_type.PRECEDENCE > self.PRECEDENCE:
-            result = '(' + result + ')'
-        return self.base_type.c_definition(result)
+        try:
+            return self._c_definitions[refering_def]
+        except KeyError:
+            result = f'{refering_def}[{self.element_count}]'
+            result = self._decorate_c_definition(result)
+            if self.base_type.PRECEDENCE > self.PRECEDENCE:
+                result = '(' + result + ')'
+            result = self.base_type.c_definition(result)
+            if self._has_constant_c_definition():
+                self._c_definitions[refering_def] = result
+            return result
 
     def shallow_iter_subtypes(self):
-        yield self.base_type
+        return iter((self.base_type,))
         
+    def _encode_str(self, py_val):
+        """
+        returns the c repr of the python string py_val (without padding) or
+        None, if the base type does not support unicode strings
+        """
+        codec = unicode_codec(self.base_type)
+        if codec is None:
+            return None
+        return py_val.encode(codec, 'surrogatepass')
+
     def convert_to_c_repr(self, py_val):
         try:
             return super().convert_to_c_repr(py_val)
@@ -72,8 +160,22 @@ class CArrayType(CProxyType):
             if isinstance(py_val, (bytes, bytearray)) and \
                     self.base_type.sizeof == 1:
                 return py_val + (b'\x00' * (self.sizeof - len(py_val)))
+            if isinstance(py_val, str):
+                payload = self._encode_str(py_val)
+                if payload is not None:
+                    if len(payload) > self.sizeof:
+                        raise ValueError('string is too long')
+                    return payload + (b'\x00' * (self.sizeof - len(payload)))
             if isinstance(py_val, Iterable):
-                payload = b''.join(map(self.base_type.convert_to_c_repr,py_val))
+                py_val = list(py_val)
+                fmt = int_struct_format(self.base_type, len(py_val))
+                try:
+                    payload = struct.pack(fmt, *py_val)
+                except (TypeError, struct.error):
+                    # no int type (fmt is None) or items that struct cannot
+                    # handle (i.e. CProxy objects or values out of range)
+                    payload = b''.join(map(self.base_type.convert_to_c_repr,
+                                           py_val))
                 return payload + (b'\x00' * (self.sizeof - len(payload)))
             else:
                 raise
@@ -84,9 +186,14 @@ class CArrayType(CProxyType):
         if len(c_repr) % self.base_type.sizeof != 0:
             raise ValueError('c_repr is not multiple of size of basetype')
         element_size = self.base_type.sizeof
-        py_repr = [
-            self.base_type.convert_from_c_repr(c_repr[pos:pos + element_size])
-            for pos in range(0, len(c_repr), element_size)]
+        fmt = int_struct_format(self.base_type, len(c_repr) // element_size)
+        if fmt is not None:
+            py_repr = list(struct.unpack(fmt, c_repr))
+        else:
+            py_repr = [
+                self.base_type.convert_from_c_repr(
+                    c_repr[pos:pos + element_size])
+                for pos in range(0, len(c_repr), element_size)]
         return py_repr + ([0] * (self.element_count - len(py_repr)))
 
     @property
@@ -96,6 +203,8 @@ class CArrayType(CProxyType):
 
 class CArray(CProxy):
 
+    __slots__ = ()
+
     @property
     def base_type(self):
         return self.ctype.base_type
@@ -138,27 +247,49 @@ class CArray(CProxy):
     def __iter__(self):
         return (self[ndx] for ndx in range(self.element_count))
 
+    def _zero_terminated_c_repr(self):
+        c_repr = self.ctype.__addrspace__.read_memory(self.__address__,
+                                                      self.sizeof)
+        return c_repr[:find_zero_terminator(c_repr, self.base_type.sizeof)]
+
     @property
     def c_str(self):
+        if self.base_type.sizeof == 1:
+            return self._zero_terminated_c_repr()
         val = self.val
         terminator_pos = val.index(0)
         return bytes(val[0:terminator_pos])
 
-    @c_str.setter
-    def c_str(self, new_val):
-        if len(new_val) >= len(self):
+    def _set_zero_terminated(self, new_val):
+        # the length of encoded strings may differ from their number of
+        # characters (i.e. utf-8). Thus the size of the c repr is checked
+        c_repr = self.ctype._encode_str(new_val) \
+            if isinstance(new_val, str) else None
+        if c_repr is not None:
+            too_long = len(c_repr) >= self.sizeof
+        else:
+            too_long = len(new_val) >= len(self)
+        if too_long:
             raise ValueError('string is too long')
         self.val = new_val
 
+    @c_str.setter
+    def c_str(self, new_val):
+        self._set_zero_terminated(new_val)
+
     @property
     def unicode_str(self):
+        codec = unicode_codec(self.base_type)
+        if codec is not None:
+            return self._zero_terminated_c_repr().decode(codec,
+                                                         'surrogatepass')
         val = self.val
         terminator_pos = val.index(0)
         return ''.join(map(chr, self[0:terminator_pos]))
 
     @unicode_str.setter
     def unicode_str(self, new_val):
-        self.val = new_val
+        self._set_zero_terminated(new_val)
 
     def __add__(self, other):
         return self[0].adr + other
@@ -1,4 +1,5 @@
 import copy
+import weakref
 from ..address_space import AddressSpace
 from .memory_access import CMemory, WriteProtectError
 from typing import Any, Iterable
@@ -11,16 +12,58 @@ class InvalidAddressSpaceError(Exception):
     """
 
 
+class InterningMeta(type):
+    """
+    Metaclass of CProxyTypes, whose instances are interned. Instantiating
+    such a class with the same parameters again returns the already
+    existing instance without running __init__() on it again.
+
+    The key of an instance is returned by the classmethod _intern_key(),
+    which accepts the same parameters as __init__(). If it returns None,
+    the instance is not interned. Objects that are created without calling
+    the class (copies by copy.copy() or unpickled objects) bypass the
+    interning.
+    """
+
+    def __init__(cls, *args, **argv):
+        super().__init__(*args, **argv)
+        cls.__instances = weakref.WeakValueDictionary()
+
+    def __call__(cls, *args, **argv):
+        key = cls._intern_key(*args, **argv)
+        if key is None:
+            return super().__call__(*args, **argv)
+        try:
+            return cls.__instances[key]
+        except KeyError:
+            instance = cls.__instances[key] = super().__call__(*args, **argv)
+            return instance
+
+
 class CProxyType:
 
     CPROXY_CLASS:type = None
 
     PRECEDENCE = 0
 
+    # True for types, whose C definition may change after they are created
+    C_DEFINITION_MAY_CHANGE = False
+
     def __init__(self, size:int, addrspace:AddressSpace=None):
-        self.__c_attribs__ = frozenset()
+        # sorted tuple of attribute names (see with_attr())
+        self.__c_attribs__ = ()
         self.__addrspace__ = addrspace
         self.sizeof = size
+        self._attr_derivations = {}
+
+    def __copy__(self):
+        # all derived types (bind(), with_attr(), ...) are created via
+        # copy.copy(). object.__new__() is used to bypass the interning of
+        # subclasses, as the copy gets modified afterwards
+        derived = object.__new__(type(self))
+        derived.__dict__.update(self.__dict__)
+        derived._attr_derivations = {}
+        return derived
 
     def bind(self, addrspace:AddressSpace):
         if addrspace is self.__addrspace__:
@@ -68,12 +111,16 @@ class CProxyType:
     def __eq__(self, other:'CProxyType') -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
+        elif self is other:
+            return True
         else:
             remaining = [(self, other)]
             processed = set()
             while remaining:
                 (self_ctype, other_ctype) = remaining.pop()
-                if (id(self_ctype), id(other_ctype)) not in processed:
+                # identical (i.e. interned) subtypes need no structural compare
+                if self_ctype is not other_ctype and \
+                        (id(self_ctype), id(other_ctype)) not in processed:
                     if not self_ctype.shallow_eq(other_ctype):
                         return False
                     remaining += zip(self_ctype.shallow_iter_subtypes(),
@@ -113,14 +160,21 @@ class CProxyType:
         raise NotImplementedError('this is an abstract base class')
 
     def _decorate_c_definition(self, c_def):
-        return ''.join(attr + ' ' for attr in sorted(self.__c_attribs__)) + c_def
+        return ''.join(attr + ' ' for attr in self.__c_attribs__) + c_def
 
     def with_attr(self, attr_name):
         if attr_name in self.__c_attribs__:
             raise ValueError(f'attribute {attr_name} is already set')
-        derived = copy.copy(self)
-        derived.__c_attribs__ = self.__c_attribs__ | {attr_name}
-        return derived
+        # derived types are cached, as the same attributes (i.e. 'const') are
+        # applied to the same types again and again
+        try:
+            return self._attr_derivations[attr_name]
+        except KeyError:
+            derived = copy.copy(self)
+            derived.__c_attribs__ = tuple(
+                sorted(self.__c_attribs__ + (attr_name,)))
+            self._attr_derivations[attr_name] = derived
+            return derived
 
     def get_pure_ctype(self):
         """
@@ -129,7 +183,7 @@ class CProxyType:
         """
         if self.__c_attribs__:
             derived = copy.copy(self)
-            derived.__c_attribs__ = set()
+            derived.__c_attribs__ = ()
             return derived
         else:
             return self
@@ -138,23 +192,43 @@ class CProxyType:
                       parent=None, processed=None):
         if processed is None:
             processed = set()
-        ident = self.ident()
-        if ident not in processed:
-            if filter is None or filter(self, parent):
-                processed.add(ident)
-                if not top_level_last:
-                    yield self
-                for sub_type in self.shallow_iter_subtypes():
-                    yield from sub_type.iter_subtypes(top_level_last, filter,
-                                                      self, processed)
+        # walks the type tree via an explicit stack of subtype iterators
+        # instead of recursive generators (one per nesting level)
+        stack = []
+        sub_types, sub_parent = iter((self,)), parent
+        while True:
+            for ctype in sub_types:
+                ident = ctype.ident()
+                if ident not in processed \
+                        and (filter is None or filter(ctype, sub_parent)):
+                    processed.add(ident)
+                    if not top_level_last:
+                        yield ctype
+                    stack.append((sub_types, sub_parent))
+                    sub_types = iter(ctype.shallow_iter_subtypes())
+                    sub_parent = ctype
+                    break
+            else:
+                if not stack:
+                    return
                 if top_level_last:
-                    yield self
+                    yield sub_parent
+                sub_types, sub_parent = stack.pop()
 
     def ident(self) -> int:
         return id(self)
 
+    def _has_constant_c_definition(self) -> bool:
+        """
+        Returns False, if the C definition of this type or of one of its
+        subtypes may change after creation (see C_DEFINITION_MAY_CHANGE).
+        Only types with constant C definitions may cache them.
+        """
+        return not any(ctype.C_DEFINITION_MAY_CHANGE
+                       for ctype in self.iter_subtypes())
+
     def shallow_iter_subtypes(self) -> Iterable:
-        return iter([])
+        return iter(())
 
     def has_attr(self, attr_name) -> bool:
         return attr_name in self.__c_attribs__
@@ -169,9 +243,12 @@ class CProxyType:
 
 class CProxy:
 
+    # CProxy objects are created on every member/element access. Thus they
+    # do not get a __dict__ (subclasses have to define __slots__, too)
+    __slots__ = ('ctype', '__address__')
+
     def __init__(self, ctype:CProxyType, address:int):
-        super(CProxy, self).__init__()
-        self.ctype =  ctype
+        self.ctype = ctype
         self.__address__ = address
 
     def __repr__(self):
@@ -182,8 +259,7 @@ class CProxy:
 
     @property
     def adr(self):
-        cptr_type = self.ctype.ptr
-        return cptr_type(self.__address__)
+        return self.ctype.ptr(self.__address__)
 
     @property
     def sizeof(self):
@@ -192,15 +268,16 @@ class CProxy:
     @property
     def val(self):
         ctype = self.ctype
-        c_repr = ctype.__addrspace__.read_memory(self.__address__, self.sizeof)
+        c_repr = ctype.__addrspace__.read_memory(self.__address__, ctype.sizeof)
         return ctype.convert_from_c_repr(c_repr)
 
     @val.setter
     def val(self, py_val):
-        if self.ctype.has_attr('const'):
+        ctype = self.ctype
+        if ctype.has_attr('const'):
             raise WriteProtectError('must not change const variable')
-        c_repr = self.ctype.convert_to_c_repr(py_val)
-        self.ctype.__addrspace__.write_memory(self.__address__, c_repr)
+        c_repr = ctype.convert_to_c_repr(py_val)
+        ctype.__addrspace__.write_memory(self.__address__, c_repr)
 
     def __eq__(self, other):
         if isinstance(other, CProxy):
@@ -260,11 +337,12 @@ class CProxy:
         return self
 
     def copy(self):
-        addrspace = self.ctype.__addrspace__
-        new_block = addrspace.alloc_memory(self.sizeof)
-        rawdata = addrspace.read_memory(self.__address__, self.sizeof)
+        ctype = self.ctype
+        addrspace = ctype.__addrspace__
+        new_block = addrspace.alloc_memory(ctype.sizeof)
+        rawdata = addrspace.read_memory(self.__address__, ctype.sizeof)
         addrspace.write_memory(new_block, rawdata)
-        return type(self)(self.ctype, new_block)
+        return type(self)(ctype, new_block)
 
     @property
     def mem(self):
@@ -4,6 +4,10 @@ from .integer import CIntType, CInt
 class CEnumType(CIntType):
     """This is a dummy implemenetation to make enums parsable"""
 
+    @classmethod
+    def _intern_key(cls, name=None):
+        return name
+
     def __init__(self, name=None):
         super().__init__(name or '', 32, False, 'little')
 
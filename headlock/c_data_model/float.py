@@ -15,6 +15,6 @@ class CFloatType(CProxyType):
 
 class CFloat(CProxy):
     """This is a dummy yet"""
-    pass
+    __slots__ = ()
 
 CFloatType.CPROXY_CLASS = CFloat
@@ -25,6 +25,8 @@ class CFuncPointerType(CPointerType):
 
 class CFuncPointer(CPointer):
 
+    __slots__ = ()
+
     def __call__(self, *args):
         return self.ref(*args)
 
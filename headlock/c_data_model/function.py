@@ -1,19 +1,31 @@
-import weakref
-from .core import CProxyType, CProxy, InvalidAddressSpaceError
+import sys
+from .core import CProxyType, CProxy, InvalidAddressSpaceError, \
+    InterningMeta
 from .void import CVoidType
 from ..address_space import AddressSpace
-from typing import Union, TextIO, List
+from typing import Union, TextIO, Sequence
 from functools import partial
 
 
-class CFuncType(CProxyType):
+class CFuncType(CProxyType, metaclass=InterningMeta):
 
     PRECEDENCE = 20
 
-    def __init__(self, returns:CProxyType=None, args:List[CProxyType]=None,
+    @classmethod
+    def _intern_key(cls, returns:CProxyType=None,
+                    args:Sequence[CProxyType]=None,
+                    addrspace:AddressSpace=None):
+        # see CIntType._intern_key(). As an interned object keeps its return
+        # and argument types alive, their ids are unique within the key.
+        # Instances created without any parameter are not interned
+        if returns is None and args is None and addrspace is None:
+            return None
+        return id(returns), tuple(map(id, args or ())), id(addrspace)
+
+    def __init__(self, returns:CProxyType=None, args:Sequence[CProxyType]=None,
                  addrspace:AddressSpace=None):
         self.returns = returns
-        self.args = args or []
+        self.args = tuple(args or ())
         if returns is not None and addrspace is not self.returns.__addrspace__:
             raise InvalidAddressSpaceError(
                 'Return type of function has different addressspace than '
@@ -23,12 +35,28 @@ class CFuncType(CProxyType):
                 'A argument type of function has different addressspace than '
                 'function type')
         super().__init__(None, addrspace)
+        self._c_definitions = {}
+        self._c_params_def = None
+        self._params_size = None
+        self._arg_converters = None
+
+    def __copy__(self):
+        # see CArrayType.__copy__()
+        derived = super().__copy__()
+        derived._c_definitions = {}
+        derived._c_params_def = None
+        derived._params_size = None
+        derived._arg_converters = None
+        return derived
 
     def bind(self, addrspace:AddressSpace):
         bound_ctype = super().bind(addrspace)
+        if bound_ctype is self:
+            # already bound to addrspace (and thus all subtypes, too)
+            return self
         if bound_ctype.returns is not None:
             bound_ctype.returns = bound_ctype.returns.bind(addrspace)
-        bound_ctype.args = [a.bind(addrspace) for a in bound_ctype.args]
+        bound_ctype.args = tuple(a.bind(addrspace) for a in bound_ctype.args)
         return bound_ctype
 
     def shallow_eq(self, other):
@@ -38,9 +66,10 @@ class CFuncType(CProxyType):
                and len(self.args) == len(other.args)
 
     def shallow_iter_subtypes(self):
-        if self.returns:
-            yield self.returns
-        yield from self.args
+        if self.returns is None:
+            return iter(self.args)
+        else:
+            return iter((self.returns,) + self.args)
 
     @property
     def ptr(self):
@@ -57,29 +86,49 @@ class CFuncType(CProxyType):
             return super()._decorate_c_definition(c_def)
 
     def c_definition(self, refering_def='f'):
-        if len(self.args) == 0:
-            partype_strs = ('void',)
-        else:
-            partype_strs = (arg.c_definition(f'p{ndx}')
-                            for ndx, arg in enumerate(self.args))
-        rettype = self.returns or CVoidType()
-        deco = (refering_def) + '('+', '.join(partype_strs)+')'
-        return rettype.c_definition(self._decorate_c_definition(deco))
+        try:
+            return self._c_definitions[refering_def]
+        except KeyError:
+            if self._c_params_def is None:
+                # the parameter list does not depend on refering_def
+                if len(self.args) == 0:
+                    partype_strs = ('void',)
+                else:
+                    partype_strs = (arg.c_definition(f'p{ndx}')
+                                    for ndx, arg in enumerate(self.args))
+                params_def = '(' + ', '.join(partype_strs) + ')'
+            else:
+                params_def = self._c_params_def
+            rettype = self.returns or CVoidType()
+            deco = refering_def + params_def
+            # interned, as c_sig is used as key for looking up the bridges
+            result = sys.intern(
+                rettype.c_definition(self._decorate_c_definition(deco)))
+            if self._has_constant_c_definition():
+                self._c_params_def = params_def
+                self._c_definitions[refering_def] = result
+            return result
 
     def __repr__(self):
         arg_repr_str = ', '.join(map(repr, self.args))
         attr_calls_str = ''.join(f'.with_attr({attr!r})'
-                                 for attr in sorted(self.__c_attribs__))
+                                 for attr in self.__c_attribs__)
         return f'CFuncType({self.returns!r}, [{arg_repr_str}]){attr_calls_str}'
 
     def bridge_c2py(self, py_callable:callable,
                     params_adr:int, retval_adr:int,
                     name:str=None, logger:TextIO=None):
-        next_param_adr = params_adr
         params = []
-        for arg_type in self.args:
-            params.append(arg_type.create_cproxy_for(next_param_adr).copy())
-            next_param_adr += arg_type.sizeof
+        params_size = self.params_size
+        if params_size > 0:
+            # copy all parameters at once (instead of one by one)
+            addrspace = self.__addrspace__
+            next_param_adr = addrspace.alloc_memory(params_size)
+            addrspace.write_memory(
+                next_param_adr, addrspace.read_memory(params_adr, params_size))
+            for arg_type in self.args:
+                params.append(arg_type.create_cproxy_for(next_param_adr))
+                next_param_adr += arg_type.sizeof
         if logger:
             if name is None:
                 name = py_callable.__name__ if hasattr(py_callable, '__name__')\
@@ -111,6 +160,32 @@ class CFuncType(CProxyType):
             adr = init_val
         return self.create_cproxy_for(adr)
 
+    @property
+    def params_size(self) -> int:
+        """
+        returns the size of the memory block that contains all parameters
+        """
+        if self._params_size is not None:
+            return self._params_size
+        params_size = sum(arg.sizeof for arg in self.args)
+        # the sizes of struct parameters may change until their definition
+        # is complete (see CProxyType._has_constant_c_definition())
+        if self._has_constant_c_definition():
+            self._params_size = params_size
+        return params_size
+
+    def convert_args_to_c_repr(self, args) -> bytes:
+        """
+        returns the C representation of the parameter block for 'args'
+        """
+        # the bound conversion methods are resolved only once per CFuncType
+        # instead of once per argument and call
+        if self._arg_converters is None:
+            self._arg_converters = tuple(arg.convert_to_c_repr
+                                         for arg in self.args)
+        return b''.join(conv(arg)
+                        for conv, arg in zip(self._arg_converters, args))
+
     @property
     def c_sig(self) -> str:
         """
@@ -121,6 +196,8 @@ class CFuncType(CProxyType):
 
 class CFunc(CProxy):
 
+    __slots__ = ()
+
     @property
     def val(self):
         return self.__address__
@@ -139,13 +216,13 @@ class CFunc(CProxy):
 
     def __call__(self, *args):
         global last_tunnelled_exception
-        if len(args) != len(self.ctype.args):
-            raise TypeError(f'{self.name}() requires {len(self.ctype.args)} '
+        ctype = self.ctype
+        if len(args) != len(ctype.args):
+            raise TypeError(f'{self.name}() requires {len(ctype.args)} '
                             f'parameters, but got {len(args)}')
-        addrspace = self.ctype.__addrspace__
-        return_ctype = self.ctype.returns
-        params_bytes = b''.join(carg_type.convert_to_c_repr(arg)
-                          for carg_type, arg in zip(self.ctype.args, args))
+        addrspace = ctype.__addrspace__
+        return_ctype = ctype.returns
+        params_bytes = ctype.convert_args_to_c_repr(args)
         params_bufadr = addrspace.alloc_memory(len(params_bytes))
         addrspace.write_memory(params_bufadr, params_bytes)
         if return_ctype is None:
@@ -154,7 +231,7 @@ class CFunc(CProxy):
         else:
             retval = return_ctype()
             retval_address = retval.__address__
-        addrspace.invoke_c_func(self.__address__, self.ctype.c_sig,
+        addrspace.invoke_c_func(self.__address__, ctype.c_sig,
                                 params_bufadr, retval_address)
         return retval
 
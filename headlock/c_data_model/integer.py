@@ -1,9 +1,26 @@
 import collections
+import struct
 from typing import Union
-from .core import CProxyType, CProxy
+from .core import CProxyType, CProxy, InterningMeta
 
 
-class CIntType(CProxyType):
+# maps (sizeof, signed, endianess) to the struct.Struct used for conversion
+INT_STRUCTS = {
+    (size, signed, endianess): struct.Struct(
+        {'little': '<', 'big': '>'}[endianess]
+        + (fmt_char if signed else fmt_char.upper()))
+    for size, fmt_char in [(1, 'b'), (2, 'h'), (4, 'i'), (8, 'q')]
+    for signed in [True, False]
+    for endianess in ['little', 'big']}
+
+
+class CIntType(CProxyType, metaclass=InterningMeta):
+
+    @classmethod
+    def _intern_key(cls, c_name, bitsize, signed, endianess, addrspace=None):
+        # equal int types are interned, so that they are not rebuilt again
+        # and again (see InterningMeta)
+        return c_name, bitsize, signed, endianess, id(addrspace)
 
     def __init__(self, c_name, bitsize, signed, endianess, addrspace=None):
         if endianess not in ('big', 'little'):
@@ -13,6 +30,11 @@ class CIntType(CProxyType):
         self.signed = signed
         self.endianess = endianess
         self.c_name = c_name
+        # None for sizes that are not supported by the struct module.
+        # (c reprs are always packed unsigned, as the values are cut to
+        # the unsigned range before)
+        self._pack_struct = INT_STRUCTS.get((self.sizeof, False, endianess))
+        self._unpack_struct = INT_STRUCTS.get((self.sizeof, signed, endianess))
 
     def shallow_eq(self, other):
         return super().shallow_eq(other) \
@@ -20,6 +42,18 @@ class CIntType(CProxyType):
                and self.endianess == other.endianess \
                and self.c_name == other.c_name
 
+    def __eq__(self, other):
+        # int types have no subtypes, so the generic tree walk of
+        # CProxyType.__eq__() is not needed
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self is other or self.shallow_eq(other)
+
+    def __hash__(self):
+        # avoids building the C definition string (see CProxyType.__hash__())
+        return hash((self.c_name, self.sizeof, self.signed, self.endianess,
+                     self.__c_attribs__))
+
     @property
     def null_val(self):
         return 0
@@ -32,21 +66,37 @@ class CIntType(CProxyType):
 
     def __repr__(self):
         return ('ts.'
-                + ''.join(a+'_' for a in sorted(self.__c_attribs__))
+                + ''.join(a+'_' for a in self.__c_attribs__)
                 + self.c_name.replace(' ', '_'))
 
+    def _convert_int_to_c_repr(self, py_val):
+        cutted_val = py_val & (self.__max_val - 1)
+        if self._pack_struct is not None:
+            return self._pack_struct.pack(cutted_val)
+        return cutted_val.to_bytes(self.sizeof, self.endianess)
+
+    def _convert_chr_to_c_repr(self, py_val):
+        return self._convert_int_to_c_repr(ord(py_val))
+
     def convert_to_c_repr(self, py_val):
+        # the most common python types are dispatched by a single lookup
+        # instead of running through the generic checks (see
+        # TO_C_REPR_CONVERTERS below)
+        converter = self.TO_C_REPR_CONVERTERS.get(type(py_val))
+        if converter is not None:
+            return converter(self, py_val)
         try:
             return super().convert_to_c_repr(py_val)
         except NotImplementedError:
             if isinstance(py_val, (bytes, bytearray, str)):
                 py_val = ord(py_val)
-            cutted_val = py_val & (self.__max_val - 1)
-            return cutted_val.to_bytes(self.sizeof, self.endianess)
+            return self._convert_int_to_c_repr(py_val)
 
     def convert_from_c_repr(self, c_repr):
         if len(c_repr) != self.sizeof:
             raise ValueError(f'require C Repr of length {self.sizeof}')
+        if self._unpack_struct is not None:
+            return self._unpack_struct.unpack(c_repr)[0]
         result = int.from_bytes(c_repr, self.endianess)
         if self.signed and (result & self.__max_val // 2):
             result -= self.__max_val
@@ -59,6 +109,8 @@ class CIntType(CProxyType):
 
 class CInt(CProxy):
 
+    __slots__ = ()
+
     def __int__(self):
         return self.val
 
@@ -73,3 +125,11 @@ class CInt(CProxy):
 
 
 CIntType.CPROXY_CLASS = CInt
+
+# maps exact python types to the unbound method, that converts them into
+# the c repr of a CIntType
+CIntType.TO_C_REPR_CONVERTERS = {
+    int: CIntType._convert_int_to_c_repr,
+    bytes: CIntType._convert_chr_to_c_repr,
+    bytearray: CIntType._convert_chr_to_c_repr,
+    str: CIntType._convert_chr_to_c_repr}
@@ -45,8 +45,15 @@ class CMemory:
             raise IndexError(f'End of slice ({ndx.stop}) exceeds size of '
                              f'memory block ({self.max_address-self.address})')
 
-    def __ndx_to_slice(self, ndx):
-        return slice(ndx, ndx+1, None)
+    def __check_index(self, ndx):
+        # equivalent to self.__check_slice(slice(ndx, ndx+1)), but avoids
+        # creating a slice object on every item access
+        if ndx < 0:
+            raise IndexError(f'Negative values are not supported ({ndx})')
+        if self.max_address is not None \
+                and self.address + ndx >= self.max_address:
+            raise IndexError(f'Index ({ndx}) exceeds size of '
+                             f'memory block ({self.max_address-self.address})')
 
     def __getitem__(self, ndx:Union[int, slice]):
         if isinstance(ndx, slice):
@@ -55,12 +62,14 @@ class CMemory:
             if ndx.step is None or ndx.step == 1:
                 return self.addrspace.read_memory(self.address + start,
                                                   ndx.stop - start)
+            elif start >= ndx.stop:
+                return b''
             else:
-                return b''.join(
-                    self.addrspace.read_memory(self.address + ndx, 1)
-                    for ndx in range(start, ndx.stop, ndx.step))
+                # read the covered block at once instead of byte by byte
+                return self.addrspace.read_memory(
+                    self.address + start, ndx.stop - start)[::ndx.step]
         else:
-            self.__check_slice(self.__ndx_to_slice(ndx))
+            self.__check_index(ndx)
             return self.addrspace.read_memory(self.address + ndx, 1)[0]
 
     def __setitem__(self, ndx:Union[int, slice], value:Union[int, bytes, bytearray]):
@@ -75,16 +84,31 @@ class CMemory:
                                  'of given slice')
             if ndx.step is None:
                 return self.addrspace.write_memory(self.address + start, value)
-            else:
-                for rel_ndx, val in enumerate(value):
-                    self.addrspace.write_memory(
-                        self.address + start + rel_ndx * ndx.step, bytes([val]))
+            elif len(value) > 0:
+                # modify the covered block at once instead of byte by byte
+                block_len = (len(value) - 1) * step + 1
+                block = bytearray(self.addrspace.read_memory(
+                    self.address + start, block_len))
+                block[::step] = bytes(value)
+                self.addrspace.write_memory(self.address + start, bytes(block))
         else:
-            self.__check_slice(self.__ndx_to_slice(ndx))
+            self.__check_index(ndx)
             self.addrspace.write_memory(self.address + ndx, bytes([value]))
 
     def __iter__(self):
-        return map(self.__getitem__, itertools.count(0))
+        if self.max_address is None:
+            # the end of the block is unknown. Thus every byte has to be
+            # read separately to avoid reading beyond accessible memory
+            return map(self.__getitem__, itertools.count(0))
+        else:
+            return self.__iter_block()
+
+    def __iter_block(self):
+        # read the whole block at once instead of byte by byte
+        yield from self.addrspace.read_memory(
+            self.address, self.max_address - self.address)
+        raise IndexError(f'Iterated beyond end of memory block '
+                         f'({self.max_address-self.address})')
 
     def __repr__(self):
         result = f"{type(self).__name__}({self.addrspace!r}, {self.address}"
@@ -95,6 +119,9 @@ class CMemory:
         return result + ')'
 
     def __eq__(self, other:'CMemory'):
+        if isinstance(other, (bytes, bytearray)):
+            # bytes objects can be compared without creating a copy first
+            return self[:len(other)] == other
         try:
             other_as_bytes = bytes(other)
             other_len = len(other)
@@ -104,4 +131,7 @@ class CMemory:
             return self[:other_len] == other_as_bytes
 
     def __gt__(self, other:'CMemory'):
-        return self[:len(other)] > bytes(other)
+        other_len = len(other)
+        if not isinstance(other, (bytes, bytearray)):
+            other = bytes(other)
+        return self[:other_len] > other
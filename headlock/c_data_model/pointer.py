@@ -1,13 +1,27 @@
-import collections, itertools
-from .core import CProxyType, CProxy, InvalidAddressSpaceError
+import collections
+import struct
+from .core import CProxyType, CProxy, InvalidAddressSpaceError, \
+    InterningMeta, WriteProtectError
 from .array import CArray, map_unicode_to_list
 from ..address_space import AddressSpace
 
 
-class CPointerType(CProxyType):
+# precompiled struct formats for all pointer sizes supported by struct
+PTR_STRUCTS = {(size, endianess): struct.Struct(endianess_char + fmt_char)
+               for size, fmt_char in [(2, 'H'), (4, 'I'), (8, 'Q')]
+               for endianess, endianess_char in [('little','<'), ('big','>')]}
+
+
+class CPointerType(CProxyType, metaclass=InterningMeta):
 
     PRECEDENCE = 10
 
+    @classmethod
+    def _intern_key(cls, base_type:CProxyType, bitsize:int, endianess:str,
+                    addrspace:AddressSpace=None):
+        # see CArrayType._intern_key()
+        return id(base_type), bitsize, endianess, id(addrspace)
+
     def __init__(self, base_type:CProxyType, bitsize:int, endianess:str,
                  addrspace:AddressSpace=None):
         if base_type.__addrspace__ is not addrspace:
@@ -16,10 +30,12 @@ class CPointerType(CProxyType):
         super().__init__(bitsize // 8, addrspace)
         self.endianess = endianess
         self.base_type = base_type
+        self._struct = PTR_STRUCTS.get((self.sizeof, endianess))
 
     def bind(self, addrspace):
         bound = super().bind(addrspace)
-        bound.base_type = bound.base_type.bind(addrspace)
+        if bound is not self:
+            bound.base_type = bound.base_type.bind(addrspace)
         return bound
 
     @property
@@ -37,16 +53,26 @@ class CPointerType(CProxyType):
                and self.endianess == other.endianess
 
     def shallow_iter_subtypes(self):
-        yield self.base_type
+        return iter((self.base_type,))
 
     def __repr__(self):
         return '_'.join([repr(self.base_type)]
-                        + sorted(self.__c_attribs__)
+                        + list(self.__c_attribs__)
                         + ['ptr'])
 
+    def _convert_adr_to_c_repr(self, adr):
+        cutted_val = adr & ((1 << (self.sizeof*8)) - 1)
+        if self._struct is not None:
+            return self._struct.pack(cutted_val)
+        return cutted_val.to_bytes(self.sizeof, self.endianess)
+
     def convert_to_c_repr(self, py_val):
-        if isinstance(py_val, CArray):
-            return self.convert_to_c_repr(py_val.__address__)
+        if type(py_val) is int:
+            # fast path for addresses (i.e. CProxy.adr), which avoids
+            # raising/catching NotImplementedError in the generic path
+            return self._convert_adr_to_c_repr(py_val)
+        elif isinstance(py_val, CArray):
+            return self._convert_adr_to_c_repr(py_val.__address__)
         else:
             try:
                 return super().convert_to_c_repr(py_val)
@@ -55,14 +81,15 @@ class CPointerType(CProxyType):
                     cptr_obj = self.base_type.alloc_ptr(py_val)
                     return self.convert_to_c_repr(cptr_obj.val)
                 elif isinstance(py_val, int):
-                    cutted_val = py_val & ((1 << (self.sizeof*8)) - 1)
-                    return cutted_val.to_bytes(self.sizeof, self.endianess)
+                    return self._convert_adr_to_c_repr(py_val)
                 else:
                     raise
 
     def convert_from_c_repr(self, c_repr):
         if len(c_repr) != self.sizeof:
             raise ValueError(f'require C Repr of length {self.sizeof}')
+        if self._struct is not None:
+            return self._struct.unpack(c_repr)[0]
         return int.from_bytes(c_repr, self.endianess)
 
     @property
@@ -72,6 +99,8 @@ class CPointerType(CProxyType):
 
 class CPointer(CProxy):
 
+    __slots__ = ()
+
     @property
     def base_type(self) -> CProxyType:
         return self.ctype.base_type
@@ -80,50 +109,67 @@ class CPointer(CProxy):
     def ref(self):
         return self.base_type.create_cproxy_for(self.val)
 
+    def _read_zero_terminated(self):
+        """
+        returns the list of python values of all elements up to (excluding)
+        the first zero element.
+        """
+        # Elements are read one by one, as reading ahead could exceed the
+        # accessible memory. But they are read directly from the address
+        # space instead of via self[ndx], which would create a temporary
+        # pointer and CProxy object per element
+        base_type = self.base_type
+        read_memory = base_type.__addrspace__.read_memory
+        elem_size = base_type.sizeof
+        adr = self.val
+        result = []
+        while True:
+            val = base_type.convert_from_c_repr(read_memory(adr, elem_size))
+            if val == 0:
+                return result
+            result.append(val)
+            adr += elem_size
+
     @property
     def c_str(self):
-        string = []
-        for terminator_pos in itertools.count():
-            if self[terminator_pos] == 0:
-                break
-            else:
-                string.append(self[terminator_pos])
-        return bytes(string)
+        return bytes(self._read_zero_terminated())
+
+    def _write_vals(self, vals):
+        # the CArray created by slicing does not carry the 'const' attribute
+        # of the base type. Thus write protection has to be checked here
+        if self.base_type.has_attr('const'):
+            raise WriteProtectError('must not change const variable')
+        self[:len(vals)].val = vals
 
     @c_str.setter
     def c_str(self, new_val):
-        for ndx, b in enumerate(itertools.chain(new_val, [0])):
-            self[ndx].val = b
+        self._write_vals(list(new_val) + [0])
 
     @property
     def unicode_str(self):
-        string = []
-        for terminator_pos in itertools.count():
-            if self[terminator_pos] == 0:
-                break
-            else:
-                string.append(self[terminator_pos])
-        return ''.join(map(chr, string))
+        return ''.join(map(chr, self._read_zero_terminated()))
 
     @unicode_str.setter
     def unicode_str(self, new_val):
         if not isinstance(new_val, str):
             raise TypeError(f'Except Type str, got {type(new_val)}')
-        for ndx, ch in enumerate(map_unicode_to_list(new_val, self.base_type)):
-            self[ndx].val = ch
+        self._write_vals(map_unicode_to_list(new_val, self.base_type))
 
     def __repr__(self):
         digits = self.ctype.sizeof * 2
         fmt_str = '{!r}(0x{:0' + str(digits) + 'X})'
         return fmt_str.format(self.ctype, self.val)
 
+    def _offset_adr(self, offs):
+        return self.val + int(offs) * self.ctype.base_type.sizeof
+
     def __add__(self, offs):
-        newobj = self.copy()
-        newobj += offs
-        return newobj
+        # creates the result pointer directly with the moved address
+        # instead of copying self and modifying the copy afterwards
+        return self.ctype(self._offset_adr(offs))
 
     def __iadd__(self, offs):
-        self.val += int(offs) * self.base_type.sizeof
+        self.val = self._offset_adr(offs)
         return self
 
     def __sub__(self, other):
@@ -140,14 +186,12 @@ class CPointer(CProxy):
                     f'Cannot subtract array from pointer of different types '
                     f'({self.ctype.c_definition()} '
                     f'and {other.ctype.c_definition()})')
-            return (self.val - other[0].adr.val) // self.base_type.sizeof
+            return (self.val - other.__address__) // self.base_type.sizeof
         else:
-            newobj = self.copy()
-            newobj -= int(other)
-            return newobj
+            return self.ctype(self._offset_adr(-int(other)))
 
     def __isub__(self, offs):
-        self.val -= int(offs) * self.base_type.sizeof
+        self.val = self._offset_adr(-int(offs))
         return self
 
     def __getitem__(self, ndx):
@@ -157,9 +201,10 @@ class CPointer(CProxy):
                                  'in slices of CPointers')
             start = ndx.start or 0
             carray_type = self.base_type.array(ndx.stop - start)
-            return CArray(carray_type, (self + start).val)
+            return CArray(carray_type, self._offset_adr(start))
         else:
-            return (self + ndx).ref
+            # avoid allocating a temporary pointer object (self + ndx)
+            return self.base_type.create_cproxy_for(self._offset_adr(ndx))
 
     def __int__(self):
         return self.val
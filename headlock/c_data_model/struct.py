@@ -13,6 +13,10 @@ class CStructType(Sequence, CProxyType):
     __NEXT_ANONYMOUS_ID__ = 1
     MACHINE_WORD_SIZE = 4
 
+    # forward declared structs get their members later (delayed_def()) and
+    # anonymous structs may get renamed after parsing
+    C_DEFINITION_MAY_CHANGE = True
+
     _members_:Dict[str, CProxyType] = {}
     _members_order_:List[str] = []
 
@@ -69,6 +73,9 @@ class CStructType(Sequence, CProxyType):
             next_offset += member.sizeof
         actual_packing = (self._packing_ or self.MACHINE_WORD_SIZE)
         self.sizeof = next_offset + (-next_offset % actual_packing)
+        # types derived via with_attr() before are copies of the incomplete
+        # struct and must not be returned by with_attr() any more
+        self._attr_derivations = {}
 
     def __call__(self, *args, **argv):
         argv.update(zip(self._members_order_, args))
@@ -119,8 +126,10 @@ class CStructType(Sequence, CProxyType):
         return self.c_definition_base(refering_def=body + space + refering_def)
 
     def shallow_iter_subtypes(self):
-        if self._members_ is not None:
-            yield from self._members_.values()
+        if self._members_ is None:
+            return iter(())
+        else:
+            return iter(self._members_.values())
 
     def ident(self):
         return id(self) if self.is_anonymous_struct() else \
@@ -128,7 +137,7 @@ class CStructType(Sequence, CProxyType):
 
     def __repr__(self):
         return ('ts.struct.'
-                + ''.join(a+'_' for a in sorted(self.__c_attribs__))
+                + ''.join(a+'_' for a in self.__c_attribs__)
                 + self.struct_name.replace(' ', '_'))
 
     @property
@@ -162,7 +171,7 @@ class CStructType(Sequence, CProxyType):
                     val = py_val[member_name]
                 except KeyError:
                     val = member.null_val
-                result += b'\x00' * (self.offsetof[member_name] - len(result)) \
+                result += bytes(self.offsetof[member_name] - len(result)) \
                           + member.convert_to_c_repr(val)
             return result
 
@@ -174,6 +183,8 @@ class CStructType(Sequence, CProxyType):
 
 class CStruct(CProxy):
 
+    __slots__ = ()
+
     def __repr__(self):
         params = (name + '=' + repr(cproxy.val)
                   for name, cproxy in zip(self.ctype._members_order_, self))
@@ -6,6 +6,10 @@ class CVectorType(CIntType):
 
     name = 'vector'
 
+    @classmethod
+    def _intern_key(cls, name=None):
+        return name
+
     def __init__(self, name=None):
         super().__init__(name or '', 32, False, 'little')
 
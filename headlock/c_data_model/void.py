@@ -1,9 +1,14 @@
-from .core import CProxyType, CProxy
+from .core import CProxyType, CProxy, InterningMeta
 from ..address_space import AddressSpace
 
 
 
-class CVoidType(CProxyType):
+class CVoidType(CProxyType, metaclass=InterningMeta):
+
+    @classmethod
+    def _intern_key(cls, addrspace:AddressSpace=None):
+        # see CIntType._intern_key()
+        return id(addrspace)
 
     def __init__(self, addrspace:AddressSpace=None):
         super().__init__(None, addrspace)
@@ -19,7 +24,7 @@ class CVoidType(CProxyType):
 
 
 class CVoid(CProxy):
-    pass
+    __slots__ = ()
 
 
 CVoidType.CPROXY_CLASS = CVoid
\ No newline at end of file
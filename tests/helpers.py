@@ -13,4 +13,20 @@ def build_tree(base_dir, tree):
             build_tree(base_dir.join(sub_name), subtree)
         else:
             base_dir.join(sub_name).write_binary(subtree)
-    return Path(base_dir).resolve()
\ No newline at end of file
+    return Path(base_dir).resolve()
+
+
+class Stub:
+    """
+    Lightweight replacement for Mock(return_value=...), that records the
+    (args, kwargs) of all calls in .calls
+    """
+    __slots__ = ('return_value', 'calls')
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
@@ -1,12 +1,44 @@
 import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
 import headlock.c_data_model as cdm
 from headlock.address_space.virtual import VirtualAddressSpace
 
 
+@pytest.fixture(scope='module')
+def pooled_addrspace():
+    return VirtualAddressSpace()
+
 @pytest.fixture
-def addrspace():
+def addrspace(pooled_addrspace):
+    """
+    Address space, that is reset before every test. Tests that replace its
+    methods have to do this via monkeypatch.
+    """
+    pooled_addrspace.reset(b'abcdefgh')
+    return pooled_addrspace
+
+@pytest.fixture(scope='module')
+def shared_addrspace():
+    """
+    Address space that is shared by all tests of a module. Must only be used
+    by tests that neither allocate/modify memory nor patch the address space
+    """
     return VirtualAddressSpace(b'abcdefgh')
 
+@pytest.fixture
+def patched_cdm(monkeypatch):
+    """
+    Replaces the pointer/array type factories of cdm by mocks, which are
+    returned as attributes of a namespace
+    """
+    mocks = SimpleNamespace(CPointerType=Mock(),
+                            CArrayType=Mock(),
+                            CFuncPointerType=Mock())
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(cdm, name, mock)
+    return mocks
+
 @pytest.fixture
 def unbound_cint_type():
     return cdm.CIntType('cint', 32, True, cdm.ENDIANESS, None)
@@ -35,6 +67,16 @@ def cuint64_type(addrspace):
 def cfunc_type(addrspace):
     return cdm.CFuncType(addrspace=addrspace)
 
+@pytest.fixture
+def make_cfunc_type(addrspace):
+    """
+    Factory for CFuncTypes bound to addrspace. As CFuncTypes are interned,
+    calling it twice with the same parameters returns the same object.
+    """
+    def make_cfunc_type(returns=None, args=()):
+        return cdm.CFuncType(returns, list(args), addrspace)
+    return make_cfunc_type
+
 @pytest.fixture
 def cfunc_obj(cfunc_type):
     return cfunc_type(lambda:None)
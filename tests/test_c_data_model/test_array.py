@@ -1,9 +1,20 @@
 import pytest
-from unittest.mock import patch
+import struct
 
 import headlock.c_data_model as cdm
 from headlock.address_space.virtual import VirtualAddressSpace
 from time import time
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+
+requires_benchmark = pytest.mark.skipif(pytest_benchmark is None,
+                                        reason='requires pytest-benchmark')
+
+
+STRUCT_FMT_CHARS = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
 
 
 @pytest.fixture
@@ -11,6 +22,24 @@ def carray_type(cint_type, addrspace):
     return cdm.CArrayType(cint_type, 10, addrspace)
 
 
+@pytest.fixture
+def int_carray_factory():
+    def create_int_carray_obj(bits, init_val):
+        cint_type = cdm.CIntType('i'+str(bits), bits, False, cdm.ENDIANESS)
+        if isinstance(init_val, int):
+            content = bytes(bits//8 * init_val)
+            size = init_val
+        else:
+            fmt = ('<' if cdm.ENDIANESS == 'little' else '>') \
+                  + str(len(init_val)) + STRUCT_FMT_CHARS[bits]
+            content = struct.pack(fmt, *init_val)
+            size = len(init_val)
+        addrspace = VirtualAddressSpace(content)
+        carray_type = cdm.CArrayType(cint_type.bind(addrspace), size, addrspace)
+        return cdm.CArray(carray_type, 0)
+    return create_int_carray_obj
+
+
 class TestCArrayType:
 
     def test_init_returnsArrayCProxy(self, unbound_cint_type):
@@ -19,6 +48,16 @@ class TestCArrayType:
         assert carray_type.base_type is unbound_cint_type
         assert carray_type.element_count == 10
 
+    def test_init_onSameParams_returnsIdenticalObj(self, unbound_cint_type):
+        assert cdm.CArrayType(unbound_cint_type, 10) \
+               is cdm.CArrayType(unbound_cint_type, 10)
+
+    def test_init_onSameParams_keepsStateOfExistingObj(self, unbound_cint_type):
+        carray_type = cdm.CArrayType(unbound_cint_type, 10)
+        const_carray_type = carray_type.with_attr('const')
+        _ = cdm.CArrayType(unbound_cint_type, 10)
+        assert carray_type.with_attr('const') is const_carray_type
+
     def test_init_onBaseTypeWithDifferentAddrSpaceSet_raisesInvalidAddressSpace(self, cint_type):
         other_addrspace = VirtualAddressSpace()
         with pytest.raises(cdm.InvalidAddressSpaceError):
@@ -34,19 +73,23 @@ class TestCArrayType:
         assert list(carray_type.shallow_iter_subtypes()) \
                == [carray_type.base_type]
 
-    def test_eq_onSamePointer_returnsTrue(self, cint_type):
-        assert cdm.CPointerType(cint_type, 32, 'little') \
-               == cdm.CPointerType(cint_type, 32, 'little')
+    def test_eq_onSameArray_returnsTrue(self, unbound_cint_type):
+        assert cdm.CArrayType(unbound_cint_type, 10) \
+               == cdm.CArrayType(unbound_cint_type, 10)
+
+    @pytest.fixture(params=['othertype', 'attr', 'element_count', 'base_type'])
+    def diff_carr_type(self, request, unbound_cint_type, unbound_cint16_type):
+        if request.param == 'othertype':
+            return "othertype"
+        elif request.param == 'attr':
+            return cdm.CArrayType(unbound_cint_type, 10).with_attr('attr')
+        elif request.param == 'element_count':
+            return cdm.CArrayType(unbound_cint_type, 1000)
+        else:
+            return cdm.CArrayType(unbound_cint16_type, 10)
 
-    @pytest.mark.parametrize('diff_carr_type', [
-        "othertype",
-        cdm.CArrayType(cdm.CIntType('x', 32, True, cdm.ENDIANESS), 10)
-                             .with_attr('attr'),
-        cdm.CArrayType(cdm.CIntType('x', 32, True, cdm.ENDIANESS), 1000),
-        cdm.CArrayType(cdm.CIntType('y', 16, False, cdm.ENDIANESS), 10)])
-    def test_eq_onSamePointer_returnsTrue(self, diff_carr_type):
-        basetype = cdm.CIntType('x', 32, True, cdm.ENDIANESS)
-        assert cdm.CArrayType(basetype, 10) != diff_carr_type
+    def test_eq_onDifferentArray_returnsFalse(self, diff_carr_type, unbound_cint_type):
+        assert cdm.CArrayType(unbound_cint_type, 10) != diff_carr_type
 
     def test_len_returnsSizeOfObject(self, carray_type):
         assert len(carray_type) == carray_type.element_count
@@ -55,9 +98,9 @@ class TestCArrayType:
         assert carray_type.sizeof \
                == carray_type.element_count * carray_type.base_type.sizeof
 
-    @patch.object(cdm.CIntType, 'null_val')
-    def test_nullValue_ok(self, null_val, carray_type):
-        assert carray_type.null_val == [null_val] * carray_type.element_count
+    def test_nullValue_returnsListOfNullValsOfBaseType(self, unbound_cint_type):
+        carray_type = cdm.CArrayType(unbound_cint_type, 3)
+        assert carray_type.null_val == [unbound_cint_type.null_val] * 3
 
     def test_cDefinition_onRefDef_returnsWithRefDef(self, cint_type):
         assert cint_type.array(12).c_definition('x') == 'cint x[12]'
@@ -74,16 +117,44 @@ class TestCArrayType:
     def test_cDefinition_onPtrToArray_ok(self, cint_type):
         assert cint_type.array(10).ptr.c_definition('x') == 'cint (*x)[10]'
 
+    def test_cDefinition_onStructRenamedAfterCall_returnsNewName(self):
+        carray_type = cdm.CStructType('strct').array(2)
+        _ = carray_type.c_definition('x')
+        carray_type.base_type.struct_name = 'renamed'
+        assert carray_type.c_definition('x') == 'struct renamed x[2]'
+
     def test_repr_returnsBaseNamePlusArray(self, unbound_cint_type):
         cptr_type = cdm.CArrayType(unbound_cint_type, 123).with_attr('attr')
         assert repr(cptr_type) == 'ts.cint_attr_array123'
 
+    def test_repr_onDerivedTypeOfAlreadyReprdType_returnsReprOfDerivedType(self, unbound_cint_type):
+        carray_type = cdm.CArrayType(unbound_cint_type, 2)
+        assert repr(carray_type) == 'ts.cint_array2'
+        assert repr(carray_type.with_attr('attr')) == 'ts.cint_attr_array2'
+
+    def test_cDefinition_onDerivedTypeOfAlreadyDefinedType_returnsDefOfDerivedType(self, unbound_cint_type):
+        carray_type = cdm.CArrayType(unbound_cint_type, 2)
+        assert carray_type.c_definition('x') == 'cint x[2]'
+        assert carray_type.with_attr('const').c_definition('x') \
+               == 'cint const x[2]'
+
     def test_convertToCRepr_onPyIterable_initializesElementsWithIterablePlusNullVals(self):
         carray_type = cdm.CArrayType(cdm.CIntType('i', 32, False, 'big'), 5)
         c_repr = carray_type.convert_to_c_repr([0x11, 0x22, 0x33445566])
         assert c_repr == b'\x00\x00\x00\x11\x00\x00\x00\x22\x33\x44\x55\x66' \
                          b'\x00\x00\x00\x00\x00\x00\x00\x00'
 
+    def test_convertToCRepr_onPyIterableWithOutOfRangeVals_truncatesVals(self):
+        carray_type = cdm.CArrayType(cdm.CIntType('i', 16, False, 'little'), 2)
+        c_repr = carray_type.convert_to_c_repr([-1, 0x12345])
+        assert c_repr == b'\xFF\xFF\x45\x23'
+
+    def test_convertToCRepr_onPyIterableOfCProxies_convertsVals(self, cint_type):
+        carray_type = cint_type.array(2)
+        c_repr = carray_type.convert_to_c_repr([cint_type(0x11), 0x22])
+        assert c_repr == cint_type.convert_to_c_repr(0x11) \
+                         + cint_type.convert_to_c_repr(0x22)
+
     def test_convertToCRepr_onUtf8WithBigCodepoint_returnsArrayOfCorrectSize(self):
         carray_type = cdm.CArrayType(cdm.CIntType('i', 32, False, 'big'), 4)
         c_repr = carray_type.convert_to_c_repr('A\u1122')
@@ -96,120 +167,167 @@ class TestCArrayType:
             b'\x00\x00\x00\x11\x00\x00\x00\x22\x33\x44\x55\x66')
         assert py_repr == [0x11, 0x22, 0x33445566, 0, 0]
 
+    def test_convertFromCRepr_onSignedLittleEndianBaseType_returnsSignedInts(self):
+        carray_type = cdm.CArrayType(cdm.CIntType('i', 16, True, 'little'), 3)
+        py_repr = carray_type.convert_from_c_repr(b'\xFF\xFF\x34\x12\x00\x80')
+        assert py_repr == [-1, 0x1234, -0x8000]
+
     def test_init_onConstArray_ok(self, cint_type):
         carray_type = cint_type.with_attr('const').array(1)
         _ = carray_type()
 
     @pytest.mark.parametrize('size', [1, 4])
-    def test_getAlignment_returnsAlignmentOfBase(self, size, unbound_cint_type):
-        with patch.object(cdm.CIntType, 'alignment', size):
-            carray_type = cdm.CArrayType(unbound_cint_type, 4)
-            assert carray_type.alignment == size
+    def test_getAlignment_returnsAlignmentOfBase(self, size):
+        base_type = cdm.CIntType('i', size*8, False, cdm.ENDIANESS)
+        carray_type = cdm.CArrayType(base_type, 4)
+        assert carray_type.alignment == base_type.alignment == size
 
 
 class TestCArray:
 
-    def create_int_carray_obj(self, bits, init_val):
-        cint_type = cdm.CIntType('i'+str(bits), bits, False, cdm.ENDIANESS)
-        if isinstance(init_val, int):
-            content = b'\00' * (bits//8 * init_val)
-            size = init_val
-        else:
-            content = b''.join(map(cint_type.convert_to_c_repr, init_val))
-            size = len(init_val)
-        addrspace = VirtualAddressSpace(content)
-        carray_type = cdm.CArrayType(cint_type.bind(addrspace), size, addrspace)
-        return cdm.CArray(carray_type, 0)
-
-    def test_str_returnsStringWithZeros(self):
+    def test_str_returnsStringWithZeros(self, int_carray_factory):
         test_vector = [ord('x'), ord('Y'), 0]
-        carray_obj = self.create_int_carray_obj(16, test_vector)
+        carray_obj = int_carray_factory(16, test_vector)
         assert str(carray_obj) == 'xY\0'
 
-    def test_getCStr_onZeroTerminatedStr_returnsBytes(self):
+    def test_getCStr_onZeroTerminatedStr_returnsBytes(self, int_carray_factory):
         test_vector = [ord('X'), ord('y'), 0]
-        carray_obj = self.create_int_carray_obj(16, test_vector)
+        carray_obj = int_carray_factory(16, test_vector)
         assert carray_obj.c_str == b'Xy'
 
-    def test_setCStr_onPyStr_changesArrayToZeroTerminatedString(self):
-        carray_obj = self.create_int_carray_obj(16, [111]*6)
+    def test_setCStr_onPyStr_changesArrayToZeroTerminatedString(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [111]*6)
         carray_obj.c_str = 'Xy\0z'
-        assert carray_obj.val == [ord('X'), ord('y'), 0, ord('z'), 0, 0]
+        exp_val = [ord('X'), ord('y'), 0, ord('z'), 0, 0]
+        assert all(carray_obj[ndx] == v for ndx, v in enumerate(exp_val))
 
-    def test_setCStr_onTooLongPyStr_raisesValueError(self):
-        array = self.create_int_carray_obj(16, [111] * 3)
+    def test_setCStr_onTooLongPyStr_raisesValueError(self, int_carray_factory):
+        array = int_carray_factory(16, [111] * 3)
         with pytest.raises(ValueError):
             array.c_str = 'Xyz'
 
-    def test_getUnicodeStr_onZeroTerminatedStr_returnsPyString(self):
+    def test_setCStr_onMultiByteStrExceedingSize_raisesValueError(self, int_carray_factory):
+        array = int_carray_factory(8, [111] * 4)
+        with pytest.raises(ValueError):
+            array.c_str = '\xe4\xe4\xe4'
+        assert array.val == [111] * 4
+
+    def test_setUnicodeStr_onMultiByteStr_storesUtf8(self, int_carray_factory):
+        array = int_carray_factory(8, [111] * 5)
+        array.unicode_str = '\xe4\xe4'
+        assert array.val == [0xC3, 0xA4, 0xC3, 0xA4, 0]
+
+    def test_setVal_onMultiByteStrExceedingSize_raisesValueError(self, int_carray_factory):
+        array = int_carray_factory(8, [111] * 4)
+        with pytest.raises(ValueError):
+            array.val = '\xe4\xe4\xe4'
+
+    def test_getUnicodeStr_onZeroTerminatedStr_returnsPyString(self, int_carray_factory):
         test_vector = [0x1234, 0x56, 0]
-        carray_obj = self.create_int_carray_obj(16, test_vector)
+        carray_obj = int_carray_factory(16, test_vector)
         assert carray_obj.unicode_str == '\u1234\x56'
 
-    def test_setUnicodeStr_onPyStr_changesArrayToZeroTerminatedString(self):
-        carray_obj = self.create_int_carray_obj(16, [111] * 6)
+    def test_getUnicodeStr_onZeroBytesWithinElements_ignoresThem(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0x1200, 0x0034, 0])
+        assert carray_obj.unicode_str == '\u1200\x34'
+
+    def test_getUnicodeStr_onMissingZeroTerminator_raisesValueError(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0x11, 0x22])
+        with pytest.raises(ValueError):
+            _ = carray_obj.unicode_str
+
+    def test_setUnicodeStr_onCodepointOutsideOfBMP_isReadableAgain(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [111] * 4)
+        carray_obj.unicode_str = '\U00012345'
+        assert carray_obj.unicode_str == '\U00012345'
+
+    def test_setUnicodeStr_onPyStr_changesArrayToZeroTerminatedString(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [111] * 6)
         carray_obj.unicode_str = '\u1234\x56\0\x78'
-        assert carray_obj.val == [0x1234, 0x56, 0, 0x78, 0, 0]
+        exp_val = [0x1234, 0x56, 0, 0x78, 0, 0]
+        assert all(carray_obj[ndx] == v for ndx, v in enumerate(exp_val))
 
-    def test_init_onVeryBigBytesObject_providesOptimizedImplementation(self):
+    @requires_benchmark
+    def test_init_onVeryBigBytesObject_providesOptimizedImplementation(self, int_carray_factory, benchmark):
         big_array_size = 1000000
-        array = self.create_int_carray_obj(8, big_array_size+1)
+        array = int_carray_factory(8, big_array_size+1)
+        init_val = bytes(big_array_size)
+        benchmark.pedantic(array.ctype, (init_val,), rounds=5, warmup_rounds=1)
+        if benchmark.stats:
+            assert benchmark.stats['mean'] < 0.050
+
+    @pytest.mark.legacy
+    def test_init_onVeryBigBytesObjectWithoutBenchmark_providesOptimizedImplementation(self, int_carray_factory):
+        big_array_size = 1000000
+        array = int_carray_factory(8, big_array_size+1)
         start_timestamp = time()
-        array.ctype(b'\x00' * big_array_size)
+        array.ctype(bytes(big_array_size))
         assert time() - start_timestamp < 0.050
 
-    def test_setVal_onComplexStructure_convertsBaseType(self):
-        array = self.create_int_carray_obj(32, 2)
+    def test_setVal_onComplexStructure_convertsBaseType(self, int_carray_factory):
+        array = int_carray_factory(32, 2)
         array.val = [0x01234567, 0x89ABCDEF]
         assert array.val == [0x01234567, 0x89ABCDEF]
 
-    def test_setVal_onVeryBigBytesObject_providesOptimizedImplementation(self):
+    @requires_benchmark
+    def test_setVal_onVeryBigBytesObject_providesOptimizedImplementation(self, int_carray_factory, benchmark):
+        big_array_size = 1000000
+        array = int_carray_factory(8, big_array_size+1)
+        new_val = bytes(big_array_size)
+        def set_val():
+            array.val = new_val
+        benchmark.pedantic(set_val, rounds=5, warmup_rounds=1)
+        if benchmark.stats:
+            assert benchmark.stats['mean'] < 0.050
+
+    @pytest.mark.legacy
+    def test_setVal_onVeryBigBytesObjectWithoutBenchmark_providesOptimizedImplementation(self, int_carray_factory):
         big_array_size = 1000000
-        array = self.create_int_carray_obj(8, big_array_size+1)
+        array = int_carray_factory(8, big_array_size+1)
         start_timestamp = time()
-        array.val = b'\x00' * big_array_size
+        array.val = bytes(big_array_size)
         assert time() - start_timestamp < 0.050
 
-    def test_getVal_onComplexStructure_convertsBaseType(self):
-        array = self.create_int_carray_obj(32, [0x01234567, 0x89ABCDEF])
+    def test_getVal_onComplexStructure_convertsBaseType(self, int_carray_factory):
+        array = int_carray_factory(32, [0x01234567, 0x89ABCDEF])
         assert array.val == [0x01234567, 0x89ABCDEF]
 
-    def test_getItem_returnsObjectAtNdx(self):
-        carray_obj = self.create_int_carray_obj(16, [1, 2, 3, 4])
+    def test_getItem_returnsObjectAtNdx(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [1, 2, 3, 4])
         assert carray_obj[2].__address__ \
                == carray_obj.__address__ + 2*carray_obj.base_type.sizeof
 
-    def test_getItem_onNegativeIndex_returnsElementFromEnd(self):
-        carray_obj = self.create_int_carray_obj(16, [0]*5)
+    def test_getItem_onNegativeIndex_returnsElementFromEnd(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0]*5)
         assert carray_obj[-2].__address__ == carray_obj[3].__address__
 
-    def test_getItem_onSlice_returnsSubArray(self):
-        carray_obj = self.create_int_carray_obj(16, [1, 2, 3, 4])
+    def test_getItem_onSlice_returnsSubArray(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [1, 2, 3, 4])
         sliced_carray_obj = carray_obj[1:3]
         assert isinstance(sliced_carray_obj, cdm.CArray)
         assert sliced_carray_obj.base_type == carray_obj.base_type
         assert sliced_carray_obj.__address__ == carray_obj[1].__address__
         assert sliced_carray_obj.element_count == 2
 
-    def test_getItem_onSliceWithSteps_raiseValueError(self):
-        carray_obj = self.create_int_carray_obj(16, [1, 2, 3, 4])
+    def test_getItem_onSliceWithSteps_raiseValueError(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [1, 2, 3, 4])
         with pytest.raises(ValueError):
             _ = carray_obj[0:4:2]
 
-    def test_getItem_onSliceWithNegativeBoundaries_returnsPartOfArrayFromEnd(self):
-        carray_obj = self.create_int_carray_obj(16, [0x11, 0x22, 0x33, 0x44])
+    def test_getItem_onSliceWithNegativeBoundaries_returnsPartOfArrayFromEnd(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0x11, 0x22, 0x33, 0x44])
         assert carray_obj[-3:-1] == [0x22, 0x33]
 
-    def test_getItem_onSliceWithOpenEnd_returnsPartOfArrayUntilEnd(self):
-        carray_obj = self.create_int_carray_obj(16, [0x11, 0x22, 0x33, 0x44])
+    def test_getItem_onSliceWithOpenEnd_returnsPartOfArrayUntilEnd(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0x11, 0x22, 0x33, 0x44])
         assert carray_obj[1:] == [0x22, 0x33, 0x44]
 
-    def test_getItem_onSliceWithOpenStart_returnsPartOfArrayFromStart(self):
-        carray_obj = self.create_int_carray_obj(16, [0x11, 0x22, 0x33, 0x44])
+    def test_getItem_onSliceWithOpenStart_returnsPartOfArrayFromStart(self, int_carray_factory):
+        carray_obj = int_carray_factory(16, [0x11, 0x22, 0x33, 0x44])
         assert carray_obj[:3] == [0x11, 0x22, 0x33]
 
-    def test_add_returnsPointer(self):
-        carray_obj = self.create_int_carray_obj(8, [0x11] * 32)
+    def test_add_returnsPointer(self, int_carray_factory):
+        carray_obj = int_carray_factory(8, [0x11] * 32)
         added_cproxy = carray_obj + 3
         assert isinstance(added_cproxy, cdm.CPointer)
         assert added_cproxy.val == carray_obj[3].__address__
@@ -219,7 +337,7 @@ class TestCArray:
         carray_obj = carray_type([1, 2, 3])
         assert repr(carray_obj) == 'ts.cint_array3([1, 2, 3])'
 
-    def test_iter_returnsIterOfElements(self):
+    def test_iter_returnsIterOfElements(self, int_carray_factory):
         data = [0x11, 0x22, 0x33, 0x44]
-        carray_obj = self.create_int_carray_obj(8, data)
+        carray_obj = int_carray_factory(8, data)
         assert list(iter(carray_obj)) == data
@@ -1,24 +1,87 @@
 import pytest
-from unittest.mock import patch, Mock, MagicMock, ANY
+import copy
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 
 import headlock.c_data_model as cdm
 import headlock.c_data_model.core as core
+from ..helpers import Stub
 
 
 
 class CMyType(cdm.PtrArrFactoryMixIn, cdm.CProxyType): pass
 
-@pytest.fixture
-def ctype():
+# dummy objects for tests, that only check the identity of objects
+ADDRSPACE_DUMMY = Mock(name='addrspace_dummy')
+OTHER_ADDRSPACE_DUMMY = Mock(name='other_addrspace_dummy')
+PY_VAL_DUMMY = Mock(name='py_val_dummy')
+
+# returned by next() to indicate an exhausted iterator
+NO_ITEM = object()
+
+class CProxyStub(cdm.CProxy):
+    """
+    CProxy with a fixed '.val', that does not need a ctype or address space
+    """
+    val = None
+    def __init__(self, val, ctype=None):
+        self.ctype = ctype
+        self.val = val
+
+class CNamedType(cdm.CProxyType):
+    def __repr__(self):
+        return 'name_of_ctype'
+
+@pytest.fixture(scope='module')
+def ctype_template():
+    """
+    Shared CMyType object. Must not be modified by tests (use 'ctype' instead)
+    """
     return CMyType(1)
 
+@pytest.fixture
+def ctype(ctype_template):
+    return copy.copy(ctype_template)
+
+
+def add_subtype_chain(ctype, duplicate=False):
+    """
+    Makes ctype contain a subtype, that contains another subtype.
+    If duplicate is True, the innermost subtype is also contained in ctype.
+    Returns all three types (top level first).
+    """
+    sub_ctype, subsub_ctype = CMyType(2), CMyType(3)
+    ctype_subtypes = (sub_ctype, subsub_ctype) if duplicate else (sub_ctype,)
+    ctype.shallow_iter_subtypes = lambda: ctype_subtypes
+    sub_ctype.shallow_iter_subtypes = lambda: (subsub_ctype,)
+    return [ctype, sub_ctype, subsub_ctype]
+
+# maps test name suffix to (iter_subtypes() kwargs, setup_subtypes) where
+# setup_subtypes(ctype) returns the expected result of iter_subtypes()
+ITER_SUBTYPES_SCENARIOS = {
+    'onNoSubTypes_yieldsSelfOnly':
+        ({}, lambda ctype: [ctype]),
+    'onNoSubTypesAndTopLevelLast_yieldsSelfOnly':
+        ({'top_level_last': True}, lambda ctype: [ctype]),
+    'onRecursiveSubTypes_yieldsFlattenedSubTypes':
+        ({}, add_subtype_chain),
+    'onTopLevelLastIsTrue_reordersElements':
+        ({'top_level_last': True}, lambda ctype: add_subtype_chain(ctype)[::-1]),
+    'onSubTypeReferencedTwice_yieldsItOnce':
+        ({}, lambda ctype: add_subtype_chain(ctype, duplicate=True)),
+    'onFilterReturnsFalse_skipsSubType':
+        ({'filter': lambda ctype, parent: False}, lambda ctype: []),
+    'onFilterReturnsTrue_doesNotSkipSubType':
+        ({'filter': lambda ctype, parent: True}, lambda ctype: [ctype]),
+}
+
 
 class TestCProxyType:
 
     def test_withAttr_createsDerivedTypeWithSameMembersPlusAttrSet(self, ctype):
         ctype.derived_member = 123
         attr_ctype = ctype.with_attr('attr')
-        assert attr_ctype.__c_attribs__ == {'attr'}
+        assert attr_ctype.__c_attribs__ == ('attr',)
         assert attr_ctype.derived_member == 123
 
     def test_withAttr_onAttrAlreadySet_raiseTypeError(self, ctype):
@@ -27,76 +90,85 @@ class TestCProxyType:
 
     def test_withAttr_callTwiceWithDifferentAttrs_mergesAttributes(self, ctype):
         attr_ctype = ctype.with_attr('attr1').with_attr('attr2')
-        assert attr_ctype.__c_attribs__ == {'attr1', 'attr2'}
+        assert attr_ctype.__c_attribs__ == ('attr1', 'attr2')
+
+    def test_withAttr_onCalledTwice_returnsSameDerivedType(self, ctype):
+        assert ctype.with_attr('attr') is ctype.with_attr('attr')
 
-    def test_hasAttr_onAttrNotSet_returnsFalse(self, ctype):
-        assert not ctype.has_attr('attr')
+    def test_withAttr_onCopiedType_doesNotReturnDerivedTypeOfOriginal(self, ctype):
+        attr_ctype = ctype.with_attr('attr')
+        assert copy.copy(ctype).with_attr('attr') is not attr_ctype
+
+    def test_hasAttr_onAttrNotSet_returnsFalse(self, ctype_template):
+        assert not ctype_template.has_attr('attr')
 
     def test_hasAttr_onAttrSet_returnsTrue(self, ctype):
         attr_test_int32_type = ctype.with_attr('attr')
         assert attr_test_int32_type.has_attr('attr')
 
-    def test_bind_createsShallowCopyWithAddrSpace(self, ctype):
-        addrspace = Mock()
-        bound_ctype = ctype.bind(addrspace)
-        assert ctype.__addrspace__ is None
+    def test_bind_createsShallowCopyWithAddrSpace(self, ctype_template):
+        bound_ctype = ctype_template.bind(ADDRSPACE_DUMMY)
+        assert ctype_template.__addrspace__ is None
         assert bound_ctype.__addrspace__ is not None
 
-    def test_bind_onAlreadyBoundObj_raisesValueError(self, ctype):
-        bound_ctype = ctype.bind(Mock())
+    def test_bind_onAlreadyBoundObj_raisesValueError(self, ctype_template):
+        bound_ctype = ctype_template.bind(ADDRSPACE_DUMMY)
         with pytest.raises(ValueError):
-            bound_ctype.bind(Mock())
+            bound_ctype.bind(OTHER_ADDRSPACE_DUMMY)
 
-    def test_bind_onSameAddressSpace_returnsIdenticalObject(self, ctype, addrspace):
-        bound_ctype = ctype.bind(addrspace)
-        assert bound_ctype.bind(addrspace) is bound_ctype
+    def test_bind_onSameAddressSpace_returnsIdenticalObject(self, ctype_template, shared_addrspace):
+        bound_ctype = ctype_template.bind(shared_addrspace)
+        assert bound_ctype.bind(shared_addrspace) is bound_ctype
 
-    def test_descriptor_onContainingClass_returnsSelf(self, ctype):
+    def test_descriptor_onContainingClass_returnsSelf(self, ctype_template):
         class Dummy:
-            attr = ctype
-        assert Dummy.attr is ctype
+            attr = ctype_template
+        assert Dummy.attr is ctype_template
 
     def test_createCProxyFor_instaniatesCProxyClass(self):
-        class CDummyType(cdm.CProxyType): CPROXY_CLASS = Mock()
+        class CDummyType(cdm.CProxyType): CPROXY_CLASS = Stub(PY_VAL_DUMMY)
         cdummy_type = CDummyType(size=1)
-        assert cdummy_type.create_cproxy_for(1234) \
-               == CDummyType.CPROXY_CLASS.return_value
-        CDummyType.CPROXY_CLASS.assert_called_with(cdummy_type, 1234)
+        assert cdummy_type.create_cproxy_for(1234) is PY_VAL_DUMMY
+        assert CDummyType.CPROXY_CLASS.calls == [((cdummy_type, 1234), {})]
 
 
     def test_call_onUnboundObj_raisesNoAddrSpaceBoundError(self, ctype):
         ctype.CPROXY_CLASS = Mock()
         with pytest.raises(cdm.InvalidAddressSpaceError):
-            ctype(Mock())
+            ctype(PY_VAL_DUMMY)
 
-    def test_call_createsObj(self, ctype, addrspace):
-        next_alloc_addr = len(addrspace.content)
+    @pytest.fixture
+    def mocked_bound_ctype(self, request, ctype, addrspace, monkeypatch):
+        """
+        ctype with the attributes of request.param, bound to addrspace. The
+        cproxy creation and writing of the initial value is mocked.
+        """
+        for attr in getattr(request, 'param', ()):
+            ctype = ctype.with_attr(attr)
         bound_ctype = ctype.bind(addrspace)
         bound_ctype.CPROXY_CLASS = Mock()
         bound_ctype.convert_to_c_repr = Mock()
-        addrspace.write_memory = Mock()
-        init_val = Mock()
-        cproxy = bound_ctype(init_val)
-        assert cproxy is bound_ctype.CPROXY_CLASS.return_value
-        bound_ctype.convert_to_c_repr.assert_called_once_with(init_val)
+        monkeypatch.setattr(addrspace, 'write_memory', Mock())
+        return bound_ctype
+
+    @pytest.mark.parametrize('mocked_bound_ctype', [(), ('const',)],
+                             ids=['noAttr', 'constAttr'],
+                             indirect=True)
+    def test_call_createsObj(self, mocked_bound_ctype, addrspace):
+        next_alloc_addr = len(addrspace.content)
+        init_val = PY_VAL_DUMMY
+        cproxy = mocked_bound_ctype(init_val)
+        assert cproxy is mocked_bound_ctype.CPROXY_CLASS.return_value
+        mocked_bound_ctype.convert_to_c_repr.assert_called_once_with(init_val)
         addrspace.write_memory.assert_called_once_with(
             next_alloc_addr,
-            bound_ctype.convert_to_c_repr.return_value)
-        bound_ctype.CPROXY_CLASS.assert_called_once_with(
-            bound_ctype, next_alloc_addr)
-
-    def test_call_onConstAttr_writesInitVal(self, ctype, addrspace):
-        bound_ctype = ctype.with_attr('const').bind(addrspace)
-        bound_ctype.CPROXY_CLASS = Mock()
-        bound_ctype.convert_to_c_repr = Mock()
-        addrspace.write_memory = Mock()
-        init_val = Mock()
-        assert bound_ctype(init_val) is bound_ctype.CPROXY_CLASS.return_value
-        addrspace.write_memory.assert_called_once()
+            mocked_bound_ctype.convert_to_c_repr.return_value)
+        mocked_bound_ctype.CPROXY_CLASS.assert_called_once_with(
+            mocked_bound_ctype, next_alloc_addr)
 
     def derive_convert_to_c_repr(self, ctype, exp_val):
         orig_convert_to_c_repr = ctype.convert_to_c_repr
-        ret_val = Mock()
+        ret_val = object()
         def convert_to_c_repr_mock(val):
             if val is exp_val:
                 return ret_val
@@ -111,79 +183,53 @@ class TestCProxyType:
         assert ctype.convert_to_c_repr(None) == ret_val
 
     def test_convertToCRepr_onCProxy_returnsValAttr(self, ctype):
-        cobj = Mock(spec=cdm.CProxy)
+        cobj = CProxyStub(PY_VAL_DUMMY)
         ret_val = self.derive_convert_to_c_repr(ctype, cobj.val)
         assert ctype.convert_to_c_repr(cobj) is ret_val
 
-    def test_iterSubType_onNoSubTypes_yieldsSelfOnly(self, ctype):
-        ctype.shallow_iter_subtypes = MagicMock()
-        assert list(ctype.iter_subtypes()) == [ctype]
-        ctype.shallow_iter_subtypes.assert_called_with()
-
-    def test_iterSubType_onFlatObj_forwardsToShallowIterSubType(self, ctype):
-        ctype.shallow_iter_subtypes = MagicMock()
-        assert list(ctype.iter_subtypes(True)) \
-               == [ctype]
-        ctype.shallow_iter_subtypes.assert_called_with()
-
-    def test_iterSubType_onRecusiveSubTypes_yieldsFlattenedSubTypes(self, ctype):
-        subsubmock = MagicMock()
-        submock = Mock()
-        submock.iter_subtypes.return_value = iter([submock, subsubmock])
-        ctype.shallow_iter_subtypes = Mock(return_value=iter([submock]))
-        assert list(ctype.iter_subtypes()) \
-                == [ctype, submock, subsubmock]
-
-    def test_iterSubType_onTopLevelFirstIsTrue_reordersElements(self, ctype):
-        submock1, submock2 = MagicMock(), MagicMock()
-        submock1.iter_subtypes = Mock(return_value=iter([submock1]))
-        submock2.iter_subtypes = Mock(return_value=iter([submock2]))
-        ctype.shallow_iter_subtypes = Mock(return_value=iter([submock1,
-                                                                  submock2]))
-        assert list(ctype.iter_subtypes(top_level_last=True)) \
-                == [submock1, submock2, ctype]
-        submock1.iter_subtypes.assert_called_with(True, ANY, ANY, ANY)
-
-    def test_iterSubType_onFilterIsSetAndFilterReturnsFalse_skipsSubType(self, ctype):
-        filter_func = Mock(return_value=False)
-        assert list(ctype.iter_subtypes(filter=filter_func)) == []
-        filter_func.assert_called_with(ctype, None)
-
-    def test_iterSubType_onFilterIsSetAndFilterReturnsFalse_doesNotSkipSubType(self, ctype):
-        filter_func = Mock(return_value=True)
-        assert list(ctype.iter_subtypes(filter=filter_func)) == [ctype]
-
-    def test_iterSubType_onFilterIsSet_passesParentToFilterAndSubType(self, ctype):
-        sub_type = MagicMock()
-        ctype.shallow_iter_subtypes = Mock(return_value=[sub_type])
-        filter_func = Mock(return_value=True)
-        parent=Mock()
+    @pytest.mark.parametrize('kwargs, setup_subtypes',
+                             ITER_SUBTYPES_SCENARIOS.values(),
+                             ids=ITER_SUBTYPES_SCENARIOS.keys())
+    def test_iterSubType_yieldsSubTypes(self, ctype, kwargs, setup_subtypes):
+        exp_subtypes = setup_subtypes(ctype)
+        assert list(ctype.iter_subtypes(**kwargs)) == exp_subtypes
+
+    def test_iterSubType_onFilterIsSet_passesParentToFilter(self, ctype):
+        sub_ctype = CMyType(2)
+        ctype.shallow_iter_subtypes = Stub((sub_ctype,))
+        filter_func = Stub(True)
+        parent = PY_VAL_DUMMY
         _ = list(ctype.iter_subtypes(filter=filter_func, parent=parent))
-        filter_func.assert_any_call(ctype, parent)
-        sub_type.iter_subtypes.assert_called_with(ANY, filter_func, ctype,
-                                                  ANY)
-
-    def test_iter_iteratesSubTypes(self, ctype):
-        assert list(iter(ctype)) == []
-
-    def test_eq_onSameAttributes_returnsTrue(self):
-        ctype1 = cdm.CProxyType(1).with_attr('a').with_attr('b')
-        ctype2 = cdm.CProxyType(1).with_attr('b').with_attr('a')
-        assert ctype1 == ctype2
-        assert not ctype1 != ctype2
-
-    def test_eq_onDifferentAttributes_returnsFalse(self):
-        ctype1 = cdm.CProxyType(1).with_attr('a').with_attr('c')
-        ctype2 = cdm.CProxyType(1).with_attr('a').with_attr('b')
-        assert not ctype1 == ctype2
-        assert ctype1 != ctype2
-
-    def test_eq_onDifferentBoundObj_returnsFalse(self, ctype):
-        bound_ctype = ctype.bind(Mock())
-        assert bound_ctype != ctype
-
-    def test_eq_onDifferentSizedTypes_returnsFalse(self):
-        assert cdm.CProxyType(2) != cdm.CProxyType(1)
+        assert filter_func.calls == [((ctype, parent), {}),
+                                     ((sub_ctype, ctype), {})]
+
+    def test_iter_iteratesSubTypes(self, ctype_template):
+        assert next(iter(ctype_template), NO_ITEM) is NO_ITEM
+
+    @pytest.mark.parametrize('create_ctype1, create_ctype2, exp_equal', [
+        (lambda: cdm.CProxyType(1).with_attr('a').with_attr('b'),
+         lambda: cdm.CProxyType(1).with_attr('b').with_attr('a'), True),
+        (lambda: cdm.CProxyType(1).with_attr('a').with_attr('c'),
+         lambda: cdm.CProxyType(1).with_attr('a').with_attr('b'), False),
+        (lambda: cdm.CProxyType(1).bind(ADDRSPACE_DUMMY),
+         lambda: cdm.CProxyType(1), False),
+        (lambda: cdm.CProxyType(2), lambda: cdm.CProxyType(1), False)],
+        ids=['onSameAttributes_returnsTrue',
+             'onDifferentAttributes_returnsFalse',
+             'onDifferentBoundObj_returnsFalse',
+             'onDifferentSizedTypes_returnsFalse'])
+    def test_eq(self, create_ctype1, create_ctype2, exp_equal):
+        ctype1 = create_ctype1()
+        ctype2 = create_ctype2()
+        assert (ctype1 == ctype2) == exp_equal
+        assert (ctype1 != ctype2) != exp_equal
+
+    def test_eq_onIdenticalSubTypes_doesNotCompareSubTypes(self, ctype):
+        sub_ctype = CMyType(2)
+        sub_ctype.shallow_eq = Stub(False)
+        ctype.shallow_iter_subtypes = lambda: iter((sub_ctype,))
+        assert ctype == copy.copy(ctype)
+        assert sub_ctype.shallow_eq.calls == []
 
     def test_cDecorateCDef_onAttrs_returnsAttrs(self, ctype):
         attr_ctype = ctype.with_attr('volatile').with_attr('other')
@@ -197,11 +243,10 @@ class TestCProxyType:
 
 class TestPtrArrFactory:
 
-    @patch.object(cdm, 'CArrayType')
-    def test_array_returnsArrayTypeOfGivenSize(self, CArrayType, ctype):
+    def test_array_returnsArrayTypeOfGivenSize(self, patched_cdm, ctype):
         array_type = ctype.array(10)
-        assert array_type is CArrayType.return_value
-        CArrayType.assert_called_once_with(ctype, 10, None)
+        assert array_type is patched_cdm.CArrayType.return_value
+        patched_cdm.CArrayType.assert_called_once_with(ctype, 10, None)
 
     @patch.object(CMyType, 'array')
     def test_allocArray_onLength_returnsArrayInstanceOfGivenSize(self, array, ctype):
@@ -209,40 +254,55 @@ class TestPtrArrFactory:
         array.assert_called_once_with(123)
         assert carray_obj is array.return_value.return_value
 
-    @pytest.mark.parametrize('initval', [[1, 2, 3, 4], iter([1, 2, 3, 4])])
-    def test_allocArray_onPyCollection_returnsArrayInstanceInitializedWithPyColl(self, initval, cint_type):
-        array = cint_type.alloc_array(initval)
-        assert array == [1, 2, 3, 4]
-
-    @pytest.mark.parametrize('initval', [b'\x01\x02\x03\x04',
-                                         '\x01\x02\x03\x04'])
-    def test_allocArray_onPyStr_returnsArrayInstanceInitializedWithZeroTerminatedByStr(self, initval, cint_type):
-        array = cint_type.alloc_array(initval)
-        assert array == [1, 2, 3, 4, 0]
-
-    @patch.object(cdm, 'CPointerType')
-    def test_ptr_returnsCPointerToSelf(self, CPointerType, ctype):
-        assert ctype.ptr is CPointerType.return_value
-        CPointerType.assert_called_once_with(
+    def test_allocArray_onPyIterable_returnsArrayInstanceInitializedWithPyIterable(self, cint_type):
+        for initval, exp_val in [
+                ([1, 2, 3, 4],        [1, 2, 3, 4]),
+                (iter([1, 2, 3, 4]),  [1, 2, 3, 4]),
+                (b'\x01\x02\x03\x04', [1, 2, 3, 4, 0]),   # zero terminated
+                ('\x01\x02\x03\x04',  [1, 2, 3, 4, 0])]:  # zero terminated
+            assert cint_type.alloc_array(initval) == exp_val
+
+    def test_ptr_returnsCPointerToSelf(self, patched_cdm, ctype):
+        assert ctype.ptr is patched_cdm.CPointerType.return_value
+        patched_cdm.CPointerType.assert_called_once_with(
             ctype, cdm.MACHINE_WORDSIZE, cdm.ENDIANESS, None)
 
-    @patch.object(cdm, 'CFuncPointerType')
-    def test_ptr_onFuncType_returnsCFFuncPointerToSelf(self, CFuncPointerType, cfunc_type):
-        assert cfunc_type.ptr is CFuncPointerType.return_value
+    def test_ptr_onFuncType_returnsCFFuncPointerToSelf(self, patched_cdm, cfunc_type):
+        assert cfunc_type.ptr is patched_cdm.CFuncPointerType.return_value
 
-    @patch.object(cdm, 'CPointerType')
-    def test_ptr_onCalledMoreThanOnce_returnsCachedPtrType(self, CPointerType, ctype):
+    def test_ptr_onCalledMoreThanOnce_returnsCachedPtrType(self, patched_cdm, ctype):
         retval1 = ctype.ptr
         retval2 = ctype.ptr
-        CPointerType.assert_called_once()
+        patched_cdm.CPointerType.assert_called_once()
         assert retval1 is retval2
 
-    def test_ptr_onAfterBind_recreatesCache(self, ctype, addrspace):
-        bound_ctype = ctype.bind(addrspace)
-        with patch.object(cdm, 'CPointerType') as CPointerType:
-            assert bound_ctype.ptr is CPointerType.return_value
-            CPointerType.assert_called_once_with(
-                bound_ctype, cdm.MACHINE_WORDSIZE, cdm.ENDIANESS, addrspace)
+    def test_ptr_onFuncTypeCalledMoreThanOnce_returnsCachedPtrType(self, patched_cdm):
+        cfunc_type = cdm.CFuncType()
+        assert cfunc_type.ptr is cfunc_type.ptr
+        patched_cdm.CFuncPointerType.assert_called_once()
+
+    def test_ptr_onAfterWithAttr_recreatesCache(self, ctype, patched_cdm):
+        _ = ctype.ptr
+        const_ctype = ctype.with_attr('const')
+        patched_cdm.CPointerType.reset_mock()
+        assert const_ctype.ptr is patched_cdm.CPointerType.return_value
+        patched_cdm.CPointerType.assert_called_once_with(
+            const_ctype, cdm.MACHINE_WORDSIZE, cdm.ENDIANESS, None)
+
+    def test_ptr_onAfterGetPureCType_recreatesCache(self, ctype, patched_cdm):
+        const_ctype = ctype.with_attr('const')
+        _ = const_ctype.ptr
+        pure_ctype = const_ctype.get_pure_ctype()
+        patched_cdm.CPointerType.reset_mock()
+        assert pure_ctype.ptr is patched_cdm.CPointerType.return_value
+        patched_cdm.CPointerType.assert_called_once_with(
+            pure_ctype, cdm.MACHINE_WORDSIZE, cdm.ENDIANESS, None)
+
+    def test_ptr_onAfterBind_recreatesCache(self, ctype, shared_addrspace, patched_cdm):
+        bound_ctype = ctype.bind(shared_addrspace)
+        assert bound_ctype.ptr is patched_cdm.CPointerType.return_value
+        patched_cdm.CPointerType.assert_called_once_with(
+            bound_ctype, cdm.MACHINE_WORDSIZE, cdm.ENDIANESS, shared_addrspace)
 
     @patch.object(CMyType, 'alloc_array')
     @patch.object(CMyType, 'ptr')
@@ -261,6 +321,41 @@ class TestPtrArrFactory:
         bound.alloc_ptr.assert_called_once_with([1, 2, 3])
 
 
+class StaticValCType:
+    """
+    Lightweight ctype replacement, whose CProxies always return 'val'
+    (independent of the memory content). Acts as its own address space.
+    """
+    __slots__ = ('val', 'convert_to_c_repr')
+    sizeof = 1
+
+    def __init__(self, val):
+        self.val = val
+        self.convert_to_c_repr = Stub()
+
+    def __call__(self, val):
+        return cobj_of_val(val)
+
+    @property
+    def __addrspace__(self):
+        return self
+
+    def read_memory(self, address, length):
+        return bytes(length)
+
+    def write_memory(self, address, data):
+        pass
+
+    def convert_from_c_repr(self, c_repr):
+        return self.val
+
+    def has_attr(self, attr_name):
+        return False
+
+def cobj_of_val(val):
+    return cdm.CProxy(StaticValCType(val), 0)
+
+
 class TestCProxy:
 
     def test_init_setsAttributes(self, ctype, addrspace):
@@ -283,14 +378,15 @@ class TestCProxy:
 
     def test_getVal_returnsConvertedCRepr(self, ctype, addrspace):
         ctype.convert_from_c_repr = convert_from_c_repr = Mock()
+        exp_c_repr = bytes(addrspace.content[:1])
         cproxy = cdm.CProxy(ctype.bind(addrspace), 0)
         assert cproxy.val is convert_from_c_repr.return_value
-        convert_from_c_repr.assert_called_once_with(addrspace.content[:1])
+        convert_from_c_repr.assert_called_once_with(exp_c_repr)
 
-    def test_setVal_storesConvertedValue(self, cobj, addrspace):
+    def test_setVal_storesConvertedValue(self, cobj, addrspace, monkeypatch):
         cobj.ctype.convert_to_c_repr = Mock()
-        addrspace.write_memory = Mock()
-        set_val = Mock()
+        monkeypatch.setattr(addrspace, 'write_memory', Mock())
+        set_val = PY_VAL_DUMMY
         cobj.val = set_val
         cobj.ctype.convert_to_c_repr.assert_called_once_with(set_val)
         addrspace.write_memory.assert_called_once_with(
@@ -302,9 +398,8 @@ class TestCProxy:
         with pytest.raises(cdm.WriteProtectError):
             cobj.val = 1
 
-    @patch.object(cdm.CProxy, 'val', 123)
-    @patch.object(cdm.CProxyType, '__repr__', return_value='name_of_ctype')
-    def test_repr_returnsCNameAndValue(self, repr_func, cobj):
+    def test_repr_returnsCNameAndValue(self):
+        cobj = CProxyStub(123, CNamedType(1))
         assert repr(cobj) == 'name_of_ctype(123)'
 
     @patch.object(CMyType, 'ptr')
@@ -314,7 +409,7 @@ class TestCProxy:
         ptr.assert_called_once_with(cobj.__address__)
 
     def test_sizeof_forwardsToCProxyType(self, cobj):
-        cobj.ctype.sizeof = Mock()
+        cobj.ctype.sizeof = PY_VAL_DUMMY
         assert cobj.sizeof is cobj.ctype.sizeof
 
     def test_copy_returnsCopyOfMemoryAndCProxy(self, cint_type):
@@ -339,7 +434,8 @@ class TestCProxy:
         cobj = cdm.CProxy(const_ctype, 0)
         assert cobj.mem.readonly
 
-    @pytest.mark.parametrize('newval', [b'123', iter(b'123')])
+    @pytest.mark.parametrize('newval', [b'123', iter(b'123')],
+                             ids=['bytes', 'iterbytes'])
     def test_setMem_onBytesConvertable_setsData(self, cobj, addrspace, newval):
         addrspace.write_memory(cobj.__address__, b'987654')
         cobj.mem = newval
@@ -351,83 +447,76 @@ class TestCProxy:
         with pytest.raises(core.WriteProtectError):
             cobj.mem = b'x'
 
-    def cobj_of_val(self, val):
-        static_val_ctype = Mock(convert_from_c_repr=Mock(return_value=val),
-                                __addrspace__=Mock(),
-                                side_effect=self.cobj_of_val,
-                                has_attr=Mock(return_value=False))
-        return cdm.CProxy(static_val_ctype, 0)
-
     def test_eq_onPyObjOfSameValue_returnsTrue(self):
-        assert self.cobj_of_val(10) == 10
-        assert 10 == self.cobj_of_val(10)
+        assert cobj_of_val(10) == 10
+        assert 10 == cobj_of_val(10)
 
     def test_eq_onPyObjOfDifferentValue_returnsFalse(self):
-        assert self.cobj_of_val(10) != 9
-        assert 9 != self.cobj_of_val(10)
+        assert cobj_of_val(10) != 9
+        assert 9 != cobj_of_val(10)
 
     def test_eq_onCProxyOfSameValue_returnsTrue(self):
-        assert self.cobj_of_val(999) == self.cobj_of_val(999)
+        assert cobj_of_val(999) == cobj_of_val(999)
 
     def test_eq_onCProxyOfDifferentValue_returnsFalse(self):
-        assert self.cobj_of_val(1000) != self.cobj_of_val(999)
+        assert cobj_of_val(1000) != cobj_of_val(999)
 
     def test_gtLt_onPyObj_ok(self):
-        assert self.cobj_of_val(4) > 3
-        assert not self.cobj_of_val(4) < 3
-        assert self.cobj_of_val(3) < 4
-        assert not self.cobj_of_val(3) > 4
+        assert cobj_of_val(4) > 3
+        assert not cobj_of_val(4) < 3
+        assert cobj_of_val(3) < 4
+        assert not cobj_of_val(3) > 4
 
     def test_geLE_onPyObj_ok(self):
-        assert self.cobj_of_val(4) >= 3
-        assert self.cobj_of_val(4) >= 4
-        assert not self.cobj_of_val(4) <= 3
-        assert self.cobj_of_val(3) <= 4
-        assert self.cobj_of_val(4) <= 4
-        assert not self.cobj_of_val(3) >= 4
+        assert cobj_of_val(4) >= 3
+        assert cobj_of_val(4) >= 4
+        assert not cobj_of_val(4) <= 3
+        assert cobj_of_val(3) <= 4
+        assert cobj_of_val(4) <= 4
+        assert not cobj_of_val(3) >= 4
 
     def test_add_onPyObj_ok(self):
-        cint_obj = self.cobj_of_val(4)
+        cint_obj = cobj_of_val(4)
         cint_obj2 = cint_obj + 1
         assert cint_obj.val == 4
         assert cint_obj2.val == 5
 
     def test_add_onCProxy_ok(self):
-        cint_obj = self.cobj_of_val(4)
-        cint_obj2 = cint_obj + self.cobj_of_val(1)
+        cint_obj = cobj_of_val(4)
+        cint_obj2 = cint_obj + cobj_of_val(1)
         assert cint_obj.val == 4
         assert cint_obj2.val == 5
 
     def test_radd_onPyObj_ok(self):
-        cint_obj = self.cobj_of_val(4)
+        cint_obj = cobj_of_val(4)
         cint_obj2 = 1 + cint_obj
         assert cint_obj.val == 4
         assert cint_obj2.val == 5
 
     def test_iadd_operatesInplace(self):
-        cint_obj = self.cobj_of_val(3)
+        cint_obj = cobj_of_val(3)
         cint_obj += 4
-        cint_obj.ctype.convert_to_c_repr.assert_called_once_with(7)
+        assert cint_obj.ctype.convert_to_c_repr.calls == [((7,), {})]
 
     def test_sub_onPyObj_ok(self):
-        cint_obj = self.cobj_of_val(4)
+        cint_obj = cobj_of_val(4)
         cint_obj2 = cint_obj - 1
         assert cint_obj.val == 4
         assert cint_obj2.val == 3
 
     def test_sub_onCProxy_ok(self):
-        cint_obj = self.cobj_of_val(4)
-        cint_obj2 = cint_obj - self.cobj_of_val(1)
+        cint_obj = cobj_of_val(4)
+        cint_obj2 = cint_obj - cobj_of_val(1)
         assert cint_obj.val == 4
         assert cint_obj2.val == 3
 
     def test_rsub_onPyObj_ok(self):
-        cint_obj = self.cobj_of_val(4)
+        cint_obj = cobj_of_val(4)
         cint_obj2 = 5 - cint_obj
         assert cint_obj.val == 4
         assert cint_obj2.val == 1
 
     def test_isub_operatesInplace(self):
-        cint_obj = self.cobj_of_val(7)
+        cint_obj = cobj_of_val(7)
         cint_obj -= 3
-        cint_obj.ctype.convert_to_c_repr.assert_called_once_with(4)
+        assert cint_obj.ctype.convert_to_c_repr.calls == [((4,), {})]
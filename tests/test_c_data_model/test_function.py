@@ -1,18 +1,26 @@
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 
 import headlock.c_data_model as cdm
 import headlock.c_data_model.function
+from ..helpers import Stub
 from headlock.address_space.inprocess import MACHINE_WORDSIZE, ENDIANESS
 
 
+@pytest.fixture
+def cproxy_class(monkeypatch):
+    cproxy_class = Mock()
+    monkeypatch.setattr(cdm.CFuncType, 'CPROXY_CLASS', cproxy_class)
+    return cproxy_class
+
+
 class TestCFuncType:
 
     def test_init_setsAttributes(self, unbound_cint_type, unbound_cint16_type):
         cfunc_type = cdm.CFuncType(unbound_cint_type,
                                    [unbound_cint_type, unbound_cint16_type])
         assert cfunc_type.returns == unbound_cint_type
-        assert cfunc_type.args == [unbound_cint_type, unbound_cint16_type]
+        assert cfunc_type.args == (unbound_cint_type, unbound_cint16_type)
 
     def test_init_onReturnTypeHasDifferentAddrSpace_raiseInvalidAddrSpaceError(self, cint_type):
         with pytest.raises(cdm.InvalidAddressSpaceError):
@@ -22,6 +30,23 @@ class TestCFuncType:
         with pytest.raises(cdm.InvalidAddressSpaceError):
             _ = cdm.CFuncType(None, [cint_type])
 
+    def test_init_onSameTypes_returnsIdenticalObj(self, unbound_cint_type):
+        assert cdm.CFuncType(unbound_cint_type, [unbound_cint_type]) \
+               is cdm.CFuncType(unbound_cint_type, (unbound_cint_type,))
+
+    def test_init_onDifferentArgs_returnsDifferentObj(self, unbound_cint_type, unbound_cint16_type):
+        assert cdm.CFuncType(None, [unbound_cint_type]) \
+               is not cdm.CFuncType(None, [unbound_cint16_type])
+
+    def test_init_onSameTypes_keepsStateOfExistingObj(self, unbound_cint_type):
+        cfunc_type = cdm.CFuncType(unbound_cint_type, [unbound_cint_type])
+        const_cfunc_type = cfunc_type.with_attr('const')
+        _ = cdm.CFuncType(unbound_cint_type, [unbound_cint_type])
+        assert cfunc_type.with_attr('const') is const_cfunc_type
+
+    def test_init_onNoParams_returnsDifferentObj(self):
+        assert cdm.CFuncType() is not cdm.CFuncType()
+
     def test_bind_bindsReturnTypeAndParameterTypes(self, unbound_cint_type, unbound_cint16_type, addrspace):
         cfunc_type = cdm.CFuncType(unbound_cint_type, [unbound_cint16_type])
         bound_cfunc_type = cfunc_type.bind(addrspace)
@@ -29,6 +54,11 @@ class TestCFuncType:
         assert all(arg.__addrspace__ == addrspace
                    for arg in bound_cfunc_type.args)
 
+    def test_bind_onSameAddressSpace_returnsIdenticalObj(self, cfunc_type, addrspace):
+        args = cfunc_type.args
+        assert cfunc_type.bind(addrspace) is cfunc_type
+        assert cfunc_type.args is args
+
     def test_eq_onSameFunc_returnsTrue(self, unbound_cint_type):
         assert cdm.CFuncType(unbound_cint_type, [unbound_cint_type]) \
                == cdm.CFuncType(unbound_cint_type, [unbound_cint_type])
@@ -75,6 +105,25 @@ class TestCFuncType:
         assert cfunc_type.c_definition('func_name') == \
                'cint func_name(cint p0, cint16 p1)'
 
+    def test_cDefinition_onDifferentReferringDefs_returnsSameParams(self, unbound_cint_type):
+        cfunc_type = cdm.CFuncType(None, [unbound_cint_type])
+        assert cfunc_type.c_definition('f1') == 'void f1(cint p0)'
+        assert cfunc_type.c_definition('(*f2)') == 'void (*f2)(cint p0)'
+
+    def test_cDefinition_onStructRenamedAfterCall_returnsNewName(self):
+        cstruct_type = cdm.CStructType('strct')
+        cfunc_type = cdm.CFuncType(cstruct_type.ptr)
+        _ = cfunc_type.c_definition('f')
+        cstruct_type.struct_name = 'renamed'
+        assert cfunc_type.c_definition('f') == 'struct renamed *f(void)'
+
+    def test_cDefinition_onArgStructRenamedAfterCall_returnsNewName(self):
+        cstruct_type = cdm.CStructType('strct')
+        cfunc_type = cdm.CFuncType(None, [cstruct_type.ptr])
+        _ = cfunc_type.c_definition('f')
+        cstruct_type.struct_name = 'renamed'
+        assert cfunc_type.c_definition('f') == 'void f(struct renamed *p0)'
+
     def test_cDefintition_onAttr_ok(self):
         cdecl_cfunc_type = cdm.CFuncType().with_attr('__cdecl')
         assert cdecl_cfunc_type.c_definition('func') \
@@ -93,12 +142,11 @@ class TestCFuncType:
         assert list(test_func.shallow_iter_subtypes()) \
                == [unbound_cint_type, unbound_cint16_type]
 
-    @patch.object(cdm, 'CFuncPointerType')
-    def test_getPtr_createsNewCFuncPtrType(self, CFuncPointerType, addrspace):
+    def test_getPtr_createsNewCFuncPtrType(self, patched_cdm, addrspace):
         cfunc_type = cdm.CFuncType(addrspace=addrspace)
         cfuncptr_type = cfunc_type.ptr
-        assert cfuncptr_type == CFuncPointerType.return_value
-        CFuncPointerType.assert_called_with(
+        assert cfuncptr_type == patched_cdm.CFuncPointerType.return_value
+        patched_cdm.CFuncPointerType.assert_called_with(
             cfunc_type, MACHINE_WORDSIZE, ENDIANESS, addrspace)
 
     def test_repr_ok(self, unbound_cint_type, unbound_cint16_type):
@@ -115,24 +163,21 @@ class TestCFuncType:
         with pytest.raises(cdm.InvalidAddressSpaceError):
             cfunc_type(0)
 
-    @patch.object(cdm.CFuncType, 'CPROXY_CLASS')
-    def test_call_onInt_callsConstructorWithFuncAdrOnly(self, CPROXY_CLASS, addrspace):
+    def test_call_onInt_callsConstructorWithFuncAdrOnly(self, cproxy_class, addrspace):
         cfunc_type = cdm.CFuncType(addrspace=addrspace)
-        assert cfunc_type(123) is CPROXY_CLASS.return_value
-        CPROXY_CLASS.assert_called_once_with(cfunc_type, 123)
+        assert cfunc_type(123) is cproxy_class.return_value
+        cproxy_class.assert_called_once_with(cfunc_type, 123)
 
-    @patch.object(cdm.CFuncType, 'CPROXY_CLASS')
-    def test_call_onStr_retrievesAdrOfSymbolAndPassesItToContructor(self, CPROXY_CLASS, addrspace, cfunc_type):
+    def test_call_onStr_retrievesAdrOfSymbolAndPassesItToContructor(self, cproxy_class, addrspace, cfunc_type):
         func_adr = addrspace.simulate_symbol('funcname', Mock())
-        assert cfunc_type('funcname') is CPROXY_CLASS.return_value
-        CPROXY_CLASS.assert_called_once_with(cfunc_type, func_adr)
+        assert cfunc_type('funcname') is cproxy_class.return_value
+        cproxy_class.assert_called_once_with(cfunc_type, func_adr)
 
-    @patch.object(cdm.CFuncType, 'CPROXY_CLASS')
-    def test_call_onCallable_bridgesCallable(self, CPROXY_CLASS, cint_type, addrspace):
+    def test_call_onCallable_bridgesCallable(self, cproxy_class, cint_type, addrspace):
         cfunc_type = cdm.CFuncType(cint_type, [cint_type, cint_type], addrspace)
         callback = Mock(return_value=0xAABBCCDD)
         cfunc_obj = cfunc_type(callback)
-        _, bridge_adr = CPROXY_CLASS.call_args[0]
+        _, bridge_adr = cproxy_class.call_args[0]
         result_adr = addrspace.alloc_memory(4)
         param_adr = addrspace.alloc_memory(8)
         addrspace.write_memory(param_adr, b'\x44\x33\x22\x11\x99\x88\x77\x66')
@@ -141,19 +186,53 @@ class TestCFuncType:
         assert addrspace.read_memory(result_adr, 4) == b'\xDD\xCC\xBB\xAA'
         callback.assert_called_once_with(0x11223344, 0x66778899)
         assert isinstance(callback.call_args[0][0], cdm.CInt)
-        assert cfunc_obj is CPROXY_CLASS.return_value
+        assert cfunc_obj is cproxy_class.return_value
 
-    @patch.object(cdm.CFuncType, 'CPROXY_CLASS')
-    def test_call_onCFunc_returnsNewCFunc(self, CPROXY_CLASS, cint_type, addrspace):
+    def test_call_onCFunc_returnsNewCFunc(self, cproxy_class, cint_type, addrspace):
         cfunc_type = cdm.CFuncType(None, addrspace=addrspace)
         cfunc_type2 = cdm.CFuncType(cint_type, [], addrspace)
         cfunc_obj = cdm.CFunc(cfunc_type, 123)
         cfunc_type2(cfunc_obj)
-        CPROXY_CLASS.assert_called_once_with(cfunc_type2, 123)
+        cproxy_class.assert_called_once_with(cfunc_type2, 123)
+
+    def test_bridgeC2Py_passesCopiesOfParams(self, cint_type, cint16_type, addrspace):
+        cfunc_type = cdm.CFuncType(None, [cint_type, cint16_type], addrspace)
+        param_adr = addrspace.alloc_memory(6)
+        addrspace.write_memory(param_adr, b'\x44\x33\x22\x11\x66\x55')
+        callback = Mock(return_value=None)
+        cfunc_type.bridge_c2py(callback, param_adr, 0)
+        addrspace.write_memory(param_adr, bytes(6))
+        p0, p1 = callback.call_args[0]
+        assert p0 == 0x11223344 and p1 == 0x5566
+        assert p0.ctype == cint_type and p1.ctype == cint16_type
+
+    def test_paramsSize_returnsSumOfArgSizes(self, unbound_cint_type, unbound_cint16_type):
+        cfunc_type = cdm.CFuncType(None, [unbound_cint_type, unbound_cint16_type])
+        assert cfunc_type.params_size == 6
+
+    def test_paramsSize_onStructDefinedAfterCall_returnsNewSize(self, unbound_cint_type):
+        cstruct_type = cdm.CStructType('strct')
+        cfunc_type = cdm.CFuncType(None, [cstruct_type])
+        _ = cfunc_type.params_size
+        cstruct_type.delayed_def([('a', unbound_cint_type),
+                                  ('b', unbound_cint_type)])
+        assert cfunc_type.params_size == 8
+
+    def test_convertArgsToCRepr_returnsConcatenatedCReprs(self, cint_type, cint16_type):
+        cfunc_type = cdm.CFuncType(None, [cint_type, cint16_type],
+                                   cint_type.__addrspace__)
+        assert cfunc_type.convert_args_to_c_repr([0x1234, 0x56]) \
+               == b'\x34\x12\x00\x00\x56\x00'
 
     def test_sigId_isCDefinitionWithReferrerF(self, cfunc_type):
         assert cfunc_type.c_sig == cfunc_type.c_definition('f')
 
+    def test_cDefinition_onDerivedTypeOfAlreadyDefinedType_returnsDefOfDerivedType(self):
+        cfunc_type = cdm.CFuncType(None, [])
+        assert cfunc_type.c_definition('x') == 'void x(void)'
+        assert cfunc_type.with_attr('attr').c_definition('x') \
+               == 'void attr x(void)'
+
 
 class TestCFunc:
 
@@ -182,58 +261,59 @@ class TestCFunc:
         unknown_adr_cfunc_obj = cfunc_type(1234)
         assert unknown_adr_cfunc_obj.name is None
 
-    def test_call_onCCode_runsAddrSpaceInvokeCCode(self, cint_type, addrspace):
+    def test_call_onCCode_runsAddrSpaceInvokeCCode(self, cint_type, addrspace, make_cfunc_type):
         addrspace.simulate_c_code('funcname', 'cint f(void)',
                                   retval=b'\x44\x33\x22\x11')
-        func_type = cdm.CFuncType(cint_type, [], addrspace)
+        func_type = make_cfunc_type(cint_type)
         func_obj = func_type('funcname')
         assert func_obj() == 0x11223344
 
-    def test_call_onArgs_passesArgs(self, cint_type, cint16_type, addrspace):
+    def test_call_onArgs_passesArgs(self, cint_type, cint16_type, addrspace, make_cfunc_type):
         addrspace.simulate_c_code('func_with_params',
                                   exp_params=b'\x34\x12\x00\x00\x56\x00')
-        cfunc_type = cdm.CFuncType(None, [cint_type, cint16_type], addrspace)
+        cfunc_type = make_cfunc_type(None, [cint_type, cint16_type])
         cfunc_obj = cfunc_type('func_with_params')
         cfunc_obj(cint_type(0x1234), 0x56)
 
-    def test_call_onSimpleResult_returnsCProxy(self, cint_type, addrspace):
-        cfunc_type = cdm.CFuncType(cint_type, addrspace=addrspace)
-        cfunc_obj = cfunc_type(Mock(return_value=123))
+    def test_call_onSimpleResult_returnsCProxy(self, cint_type, make_cfunc_type):
+        cfunc_type = make_cfunc_type(cint_type)
+        cfunc_obj = cfunc_type(Stub(123))
         result = cfunc_obj()
         assert isinstance(result, cdm.CInt)
         assert result == 123
 
     def test_call_onPyCallable_callsPyCallable(self, cfunc_type):
-        py_callable = Mock()
+        py_callable = Stub()
         cfunc_obj = cfunc_type(py_callable)
         cfunc_obj2 = cfunc_type(cfunc_obj.__address__)
         cfunc_obj2()
-        py_callable.assert_called_once()
+        assert len(py_callable.calls) == 1
 
     def test_call_onCallableWhichRaisesException_forwardsException(self, cfunc_type, addrspace):
-        callback = Mock(side_effect=ValueError('some exception text'))
+        def callback():
+            raise ValueError('some exception text')
         cfunc_obj = cfunc_type(callback)
         with pytest.raises(ValueError) as e:
             cfunc_obj()
         assert str(e.value) == 'some exception text'
 
     @pytest.mark.parametrize('wrong_param_count', [[], [1, 2]])
-    def test_call_onWrongParamCount_raisesTypeError(self, cint_type, wrong_param_count, addrspace):
-        @cdm.CFuncType(None, [cint_type], addrspace)
+    def test_call_onWrongParamCount_raisesTypeError(self, cint_type, wrong_param_count, make_cfunc_type):
+        @make_cfunc_type(None, [cint_type])
         def cfunc_obj(param):
             pass
         with pytest.raises(TypeError):
             cfunc_obj(*wrong_param_count)
 
-    def test_call_onInvalidReturnValueType_raisesValueError(self, cint_type, addrspace):
-        cfunc_type = cdm.CFuncType(cint_type, addrspace=addrspace)
-        cfunc_obj = cfunc_type(Mock(return_value=4.4))
+    def test_call_onInvalidReturnValueType_raisesValueError(self, cint_type, make_cfunc_type):
+        cfunc_type = make_cfunc_type(cint_type)
+        cfunc_obj = cfunc_type(Stub(4.4))
         with pytest.raises(TypeError):
             cfunc_obj()
 
-    def test_call_onReturnTypeVoid_returnsNone(self, addrspace):
-        void_cfunc_type = cdm.CFuncType(None, addrspace=addrspace)
-        void_cfunc_obj = void_cfunc_type(Mock())
+    def test_call_onReturnTypeVoid_returnsNone(self, make_cfunc_type):
+        void_cfunc_type = make_cfunc_type()
+        void_cfunc_obj = void_cfunc_type(Stub())
         assert void_cfunc_obj() is None
 
     @pytest.mark.skip
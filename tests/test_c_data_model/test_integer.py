@@ -1,4 +1,5 @@
 import pytest
+import copy
 from unittest.mock import Mock
 
 import headlock.c_data_model as cdm
@@ -16,6 +17,20 @@ class TestCIntType:
         assert cint_type.endianess == 'little'
         assert cint_type.__addrspace__ is addrspace
 
+    def test_init_onSameParams_returnsIdenticalObj(self):
+        assert cdm.CIntType('typename', 32, True, 'little') \
+               is cdm.CIntType('typename', 32, True, 'little')
+
+    def test_init_onSameParams_keepsStateOfExistingObj(self):
+        cint_type = cdm.CIntType('typename', 32, True, 'little')
+        const_cint_type = cint_type.with_attr('const')
+        _ = cdm.CIntType('typename', 32, True, 'little')
+        assert cint_type.with_attr('const') is const_cint_type
+
+    def test_init_onDifferentAddrSpace_returnsDifferentObj(self, addrspace):
+        assert cdm.CIntType('typename', 32, True, 'little', addrspace) \
+               is not cdm.CIntType('typename', 32, True, 'little')
+
     def test_cDefinition_returnsCName(self):
         cint_type = cdm.CIntType('typename', 32, True, 'little')
         assert cint_type.c_definition() == 'typename'
@@ -41,6 +56,14 @@ class TestCIntType:
         assert cdm.CIntType('name', 32, True, 'little') \
                == cdm.CIntType('name', 32, True, 'little')
 
+    def test_eq_onEqualButNotIdenticalCIntType_returnsTrue(self):
+        cint_type = cdm.CIntType('name', 32, True, 'little')
+        assert copy.copy(cint_type) == cint_type
+
+    def test_hash_onEqualButNotIdenticalCIntType_returnsSameHash(self):
+        cint_type = cdm.CIntType('name', 32, True, 'little').with_attr('a')
+        assert hash(copy.copy(cint_type)) == hash(cint_type)
+
     @pytest.mark.parametrize('diff_cint_type', [
         "othertype",
         cdm.CIntType('othername', 32, True, 'little'),
@@ -51,12 +74,13 @@ class TestCIntType:
     def test_eq_inDifferentCIntType_returnsFalse(self, diff_cint_type):
         assert diff_cint_type != cdm.CIntType('name', 32, True, 'little')
 
-    @pytest.mark.parametrize(('cint_type', 'expected_val'), [
-        (cdm.CIntType('name', 32, False, 'little'), b'\x21\x43\x65\x87'),
-        (cdm.CIntType('name', 16, False, 'little'), b'\x21\x43'),
-        (cdm.CIntType('name', 32, False, 'big'),    b'\x87\x65\x43\x21')])
-    def test_convertToCRepr_returnsCRepr(self, cint_type, expected_val):
-        assert cint_type.convert_to_c_repr(0x87654321) == expected_val
+    def test_convertToCRepr_returnsCRepr(self):
+        for cint_type, expected_val in [
+                (cdm.CIntType('name', 32, False, 'little'), b'\x21\x43\x65\x87'),
+                (cdm.CIntType('name', 16, False, 'little'), b'\x21\x43'),
+                (cdm.CIntType('name', 32, False, 'big'),    b'\x87\x65\x43\x21'),
+                (cdm.CIntType('name', 24, False, 'big'),    b'\x65\x43\x21')]:
+            assert cint_type.convert_to_c_repr(0x87654321) == expected_val
 
     def test_convertToCRepr_onSignBitSetAndSigned_returnsNegativePyVal(self):
         signed_cint_type = cdm.CIntType('name', 32, True, 'little')
@@ -65,21 +89,25 @@ class TestCIntType:
     def test_convertToCRepr_onBytesOfSize1_setsAsciiCode(self, cint16_type):
         assert cint16_type.convert_to_c_repr(b'\x12') == b'\x12\x00'
 
+    def test_convertToCRepr_onBytearrayOfSize1_setsAsciiCode(self, cint16_type):
+        assert cint16_type.convert_to_c_repr(bytearray(b'\x12')) == b'\x12\x00'
+
     def test_convertToCRepr_onStrOfSize1_setsUnicodeCodepoint(self, cint_type):
         assert cint_type.convert_to_c_repr('\U00012345') == b'\x45\x23\x01\x00'
 
     def test_convertToCRepr_onOtherType_forwardsToBaseClass(self, cint_type):
         assert cint_type.convert_to_c_repr(None) == b'\x00\x00\x00\x00'
 
-    @pytest.mark.parametrize(('cint_type', 'c_repr', 'py_val'), [
-        (cdm.CIntType('name', 32, False, 'little'), b'\x78\x56\x34\x12', 0x12345678),
-        (cdm.CIntType('name', 16, False, 'little'), b'\x34\x12',         0x1234),
-        (cdm.CIntType('name', 32, False, 'big'),    b'\x12\x34\x56\x78', 0x12345678),
-        (cdm.CIntType('name', 32, False, 'little'), b'\xFF\xFF\xFF\xFF', 0xFFFFFFFF),
-        (cdm.CIntType('name', 32, True,  'little'), b'\xFF\xFF\xFF\xFF', -1),
-        (cdm.CIntType('name', 8,  True,  'little'), b'\x80',             -128)])
-    def test_convertFromCRepr_returnsCRepr(self, cint_type, c_repr, py_val):
-        assert cint_type.convert_from_c_repr(c_repr) == py_val
+    def test_convertFromCRepr_returnsCRepr(self):
+        for cint_type, c_repr, py_val in [
+                (cdm.CIntType('name', 32, False, 'little'), b'\x78\x56\x34\x12', 0x12345678),
+                (cdm.CIntType('name', 16, False, 'little'), b'\x34\x12',         0x1234),
+                (cdm.CIntType('name', 32, False, 'big'),    b'\x12\x34\x56\x78', 0x12345678),
+                (cdm.CIntType('name', 32, False, 'little'), b'\xFF\xFF\xFF\xFF', 0xFFFFFFFF),
+                (cdm.CIntType('name', 32, True,  'little'), b'\xFF\xFF\xFF\xFF', -1),
+                (cdm.CIntType('name', 8,  True,  'little'), b'\x80',             -128),
+                (cdm.CIntType('name', 24, True,  'big'),    b'\xFF\xFF\xFE',     -2)]:
+            assert cint_type.convert_from_c_repr(c_repr) == py_val
 
     @pytest.mark.parametrize('size', [1, 2, 4, 8])
     def test_getAlignment_returnsSizeof(self, size):
@@ -1,18 +1,18 @@
 import pytest
 
-from headlock.address_space.virtual import VirtualAddressSpace
 from headlock.c_data_model.memory_access import CMemory, WriteProtectError
 
 
 class TestCMemory:
 
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def testdata(self):
         return b'\x12\x34\x56\x78'
 
     @pytest.fixture()
-    def addrspace(self, testdata):
-        return VirtualAddressSpace(b'\xFF' + testdata + b'\xEE\xFF')
+    def addrspace(self, testdata, pooled_addrspace):
+        pooled_addrspace.reset(b'\xFF' + testdata + b'\xEE\xFF')
+        return pooled_addrspace
 
     def test_init_onAddressOnly_setsAttributes(self, addrspace):
         cmem_obj = CMemory(addrspace, 0x1234)
@@ -35,7 +35,8 @@ class TestCMemory:
         assert cmem_obj[test_ndx] == testdata[test_ndx]
 
     @pytest.mark.parametrize('test_slice', [slice(2),    slice(1, 3),
-                                            slice(2, 4), slice(0, 4, 2)])
+                                            slice(2, 4), slice(0, 4, 2),
+                                            slice(1, 4, 2)])
     def test_getItem_onSlice_returnsBytes(self, cmem_obj, testdata, test_slice):
         assert cmem_obj[test_slice] == testdata[test_slice]
 
@@ -78,6 +79,11 @@ class TestCMemory:
         raw_iter = iter(cmem_obj)
         assert [next(raw_iter) for c in range(4)] == [0x12, 0x34, 0x56, 0x78]
 
+    def test_iter_onNoMaxAddress_readsBeyondTestdata(self, addrspace):
+        raw_iter = iter(CMemory(addrspace, 1))
+        assert [next(raw_iter) for c in range(5)] \
+               == [0x12, 0x34, 0x56, 0x78, 0xEE]
+
     def test_iter_onExceedMaxSize_raisesIndexError(self, cmem_obj):
         raw_iter = iter(cmem_obj)
         for c in range(4): next(raw_iter)
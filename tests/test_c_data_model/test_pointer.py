@@ -1,9 +1,11 @@
 import pytest
+import struct
 from contextlib import contextmanager
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import headlock.c_data_model as cdm
 from headlock.address_space.virtual import VirtualAddressSpace
+from ..helpers import Stub
 
 
 @pytest.fixture
@@ -21,6 +23,20 @@ class TestCPointerType:
         assert cptr_type.sizeof == wordsize // 8
         assert cptr_type.endianess == endianess
 
+    def test_init_onSameParams_returnsIdenticalObj(self, unbound_cint_type):
+        assert cdm.CPointerType(unbound_cint_type, 32, 'little') \
+               is cdm.CPointerType(unbound_cint_type, 32, 'little')
+
+    def test_init_onSameParams_keepsStateOfExistingObj(self, unbound_cint_type):
+        cptr_type = cdm.CPointerType(unbound_cint_type, 32, 'little')
+        const_cptr_type = cptr_type.with_attr('const')
+        _ = cdm.CPointerType(unbound_cint_type, 32, 'little')
+        assert cptr_type.with_attr('const') is const_cptr_type
+
+    def test_init_onDifferentEndianess_returnsDifferentObj(self, unbound_cint_type):
+        assert cdm.CPointerType(unbound_cint_type, 32, 'little') \
+               is not cdm.CPointerType(unbound_cint_type, 32, 'big')
+
     def test_init_onBaseTypeWithDifferentAddrSpaceSet_raisesInvalidAddressSpaceError(self, cint_type):
         with pytest.raises(cdm.InvalidAddressSpaceError):
             _ = cdm.CPointerType(cint_type, 32, 'little', VirtualAddressSpace())
@@ -31,6 +47,10 @@ class TestCPointerType:
         bound_cptr_type = cptr_type.bind(addrspace)
         assert bound_cptr_type.base_type.__addrspace__ is not None
 
+    def test_bind_onSameAddressSpace_keepsPtrCache(self, cptr_type, addrspace):
+        cptr_ptr_type = cptr_type.ptr
+        assert cptr_type.bind(addrspace).ptr is cptr_ptr_type
+
     def test_shallowIterSubTypes_onNotEmbeddedDefsOnlyIsFalse_returnsReferredTypeElementaryTypes(self, cptr_type):
         assert list(cptr_type.shallow_iter_subtypes()) \
                == [cptr_type.base_type]
@@ -72,33 +92,38 @@ class TestCPointerType:
     def test_convertFromCRepr_returnsAddressOfReferredObj(self, cptr_type):
         assert cptr_type.convert_from_c_repr(b'\x12\x34\x56\x78') == 0x12345678
 
-    @pytest.mark.parametrize(('bitsize', 'endianess', 'expected_val'), [
-        (32, 'little', b'\x21\x43\x65\x87'),
-        (16, 'little', b'\x21\x43'),
-        (32, 'big',    b'\x87\x65\x43\x21')])
-    def test_convertToCRepr_onInt_returnsCRepr(self, bitsize, endianess, expected_val, cint_type, addrspace):
-        cptr_type = cdm.CPointerType(cint_type, bitsize, endianess, addrspace)
-        assert cptr_type.convert_to_c_repr(0x87654321) == expected_val
-
-    def test_convertToCRepr_onIterable_allocatesPtrAndCastsIt(self, cptr_type, addrspace):
-        init_val = Mock(spec=list)
-        cptr_type.base_type.alloc_ptr = alloc_ptr = Mock()
-        alloc_ptr.return_value.val = 0x123
+    def test_convertToCRepr_onInt_returnsCRepr(self, cint_type, addrspace):
+        for bitsize, endianess, expected_val in [
+                (32, 'little', b'\x21\x43\x65\x87'),
+                (16, 'little', b'\x21\x43'),
+                (32, 'big',    b'\x87\x65\x43\x21'),
+                (24, 'big',    b'\x65\x43\x21')]:
+            cptr_type = cdm.CPointerType(cint_type, bitsize, endianess,
+                                         addrspace)
+            assert cptr_type.convert_to_c_repr(0x87654321) == expected_val
+
+    def test_convertToCRepr_onIterable_allocatesPtrAndCastsIt(self, cptr_type, addrspace, monkeypatch):
+        init_val = []
+        alloc_ptr = Stub(SimpleNamespace(val=0x123))
+        # base_type is interned, so the patch must not outlive the test
+        monkeypatch.setattr(cptr_type.base_type, 'alloc_ptr', alloc_ptr)
         assert cptr_type.convert_to_c_repr(init_val) == b'\x00\x00\x01\x23'
-        alloc_ptr.assert_called_once_with(init_val)
+        assert alloc_ptr.calls == [((init_val,), {})]
 
     def test_convertToCRepr_onCArray_setsAddressOfArray(self, cptr_type, cint_type):
         int_arr = cint_type.alloc_array(3)
         assert cptr_type.convert_to_c_repr(int_arr) \
                == int_arr.__address__.to_bytes(4, 'big')
 
-    @pytest.mark.parametrize(('bitsize', 'endianess', 'c_repr', 'py_val'), [
-        (32, 'little', b'\x78\x56\x34\x12', 0x12345678),
-        (16, 'little', b'\x34\x12',         0x1234),
-        (32, 'big',    b'\x12\x34\x56\x78', 0x12345678)])
-    def test_convertFromCRepr_returnsCRepr(self, bitsize, endianess, c_repr, py_val, cint_type, addrspace):
-        cptr_type = cdm.CPointerType(cint_type, bitsize, endianess, addrspace)
-        assert cptr_type.convert_from_c_repr(c_repr) == py_val
+    def test_convertFromCRepr_returnsCRepr(self, cint_type, addrspace):
+        for bitsize, endianess, c_repr, py_val in [
+                (32, 'little', b'\x78\x56\x34\x12', 0x12345678),
+                (16, 'little', b'\x34\x12',         0x1234),
+                (32, 'big',    b'\x12\x34\x56\x78', 0x12345678),
+                (24, 'big',    b'\x12\x34\x56',     0x123456)]:
+            cptr_type = cdm.CPointerType(cint_type, bitsize, endianess,
+                                         addrspace)
+            assert cptr_type.convert_from_c_repr(c_repr) == py_val
 
     @pytest.mark.parametrize('size', [4, 8])
     def test_getAlignment_returnsSizeof(self, size, unbound_cint_type):
@@ -121,14 +146,12 @@ class TestCPointer:
         cptr_type = cdm.CPointerType(
             cdm.CIntType('i32', 32, False, 'little', addrspace),
             32, 'little', addrspace)
+        fmt = f'<{len(val_list)}I'
         adr = addrspace.alloc_memory(len(val_list) * 4)
-        addrspace.write_memory(
-            adr,
-            b''.join(v.to_bytes(4, 'little') for v in val_list))
+        addrspace.write_memory(adr, struct.pack(fmt, *val_list))
         yield cptr_type(adr)
         content = addrspace.read_memory(adr, len(val_list) * 4)
-        for ndx in range(len(val_list)):
-            val_list[ndx] = int.from_bytes(content[ndx*4:ndx*4+4], 'little')
+        val_list[:] = struct.unpack(fmt, content)
 
     def test_getItem_onInt_returnsCProxyOfReferredAddress(self):
         with self.cptr_to_array_of([0, 11, 22]) as cptr_obj:
@@ -171,6 +194,22 @@ class TestCPointer:
             cptr_obj.c_str = b'Xy\0z'
         assert ref_data[:6] == [ord('X'), ord('y'), 0, ord('z'), 0, 111]
 
+    def test_setCStr_onConstBaseType_raisesWriteProtectError(self, cint_type, addrspace):
+        adr = addrspace.alloc_memory(4 * cint_type.sizeof)
+        cptr_obj = cint_type.with_attr('const').ptr(adr)
+        with pytest.raises(cdm.WriteProtectError):
+            cptr_obj.c_str = b'abc'
+        assert addrspace.read_memory(adr, 4 * cint_type.sizeof) \
+               == bytes(4 * cint_type.sizeof)
+
+    def test_setUnicodeStr_onConstBaseType_raisesWriteProtectError(self, cint_type, addrspace):
+        adr = addrspace.alloc_memory(4 * cint_type.sizeof)
+        cptr_obj = cint_type.with_attr('const').ptr(adr)
+        with pytest.raises(cdm.WriteProtectError):
+            cptr_obj.unicode_str = 'abc'
+        assert addrspace.read_memory(adr, 4 * cint_type.sizeof) \
+               == bytes(4 * cint_type.sizeof)
+
     def test_add_returnsNewPointerAtIncrementedAddress(self):
         with self.cptr_to_array_of([0] * 100) as cptr_obj:
             moved_cptr_obj = cptr_obj + 100
@@ -215,6 +254,11 @@ class TestCPointer:
         assert cobj2.adr - cobj0.adr == 2
         assert isinstance(cobj2.adr - cobj0.adr, int)
 
+    def test_sub_onCArrayObj_returnsNumberOfElementsInBetween(self, cptr_type, cint_type):
+        carray_obj = cint_type.array(3)()
+        cptr_obj = cptr_type(carray_obj.__address__ + cint_type.sizeof * 2)
+        assert cptr_obj - carray_obj == 2
+
     def test_sub_onCInt_ok(self, cint_type):
         with self.cptr_to_array_of([0] * 100) as cptr_obj:
             cint_obj = cint_type(100)
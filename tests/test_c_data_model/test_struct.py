@@ -140,6 +140,14 @@ class TestCStructType:
         assert cstruct_type.member1 is unbound_cint_type
         assert cstruct_type.member2 is unbound_cint16_type
 
+    def test_delayedDef_onWithAttrCalledBefore_derivesFromCompletedStruct(self, unbound_cint_type):
+        cstruct_type = cdm.CStructType('strct')
+        cstruct_type.with_attr('const')
+        cstruct_type.delayed_def([('member1', unbound_cint_type)])
+        const_cstruct_type = cstruct_type.with_attr('const')
+        assert const_cstruct_type.sizeof == cstruct_type.sizeof
+        assert const_cstruct_type.member1 is unbound_cint_type
+
     def test_delayedDef_onRecursiveStruct_ok(self, addrspace):
         recur_cstruct_type = cdm.CStructType('strct', addrspace=addrspace)
         recur_cstruct_type.delayed_def([('nested', recur_cstruct_type.ptr)])
@@ -379,7 +387,8 @@ class TestCStruct:
                == {'member_int':1, 'member_short':2, 'member_int2':0}
 
     @pytest.mark.parametrize('seq', [b'\x11\x22', (0x11, 0x22),
-                                     iter([0x11, 0x22])])
+                                     iter([0x11, 0x22])],
+                             ids=['bytes', 'tuple', 'iter'])
     def test_setVal_onSequence_changesMembers(self, seq, cstruct_type):
         cstruct_obj = cstruct_type(member_int2=99)
         cstruct_obj.val = seq
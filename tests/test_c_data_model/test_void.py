@@ -5,6 +5,22 @@ import headlock.c_data_model as cdm
 
 class TestCVoidType:
 
+    def test_init_onSameAddrSpace_returnsIdenticalObj(self, addrspace):
+        assert cdm.CVoidType(addrspace) is cdm.CVoidType(addrspace)
+
+    def test_init_onDifferentAddrSpace_returnsDifferentObj(self, addrspace):
+        assert cdm.CVoidType(addrspace) is not cdm.CVoidType()
+
+    def test_init_onSameAddrSpace_keepsStateOfExistingObj(self, addrspace):
+        cvoid_type = cdm.CVoidType(addrspace)
+        const_cvoid_type = cvoid_type.with_attr('const')
+        _ = cdm.CVoidType(addrspace)
+        assert cvoid_type.with_attr('const') is const_cvoid_type
+
+    def test_withAttr_onInternedObj_doesNotModifyInternedObj(self):
+        _ = cdm.CVoidType().with_attr('const')
+        assert not cdm.CVoidType().has_attr('const')
+
     def test_cDefintion_onConstAttr_returnsConstAttr(self):
         const_void = cdm.CVoidType().with_attr('const')
         assert const_void.c_definition('x') == 'const void x'